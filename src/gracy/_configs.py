@@ -13,6 +13,8 @@ within_hook_context: ContextVar[bool] = ContextVar("within_hook_context", defaul
 
 @contextmanager
 def custom_gracy_config(config: GracyConfig):
+    # set()/reset() with a Token is faster than restoring the previous value with
+    # get()/set(), since reset() doesn't need the extra lookup
     token = custom_config_context.set(config)
 
     try:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import copy
 import httpx
 import inspect
 import logging
@@ -8,9 +9,11 @@ import sys
 import typing as t
 import weakref
 from asyncio import sleep
+from collections import OrderedDict
 from contextlib import asynccontextmanager
 from http import HTTPStatus
-from time import time
+from importlib.util import find_spec
+from time import monotonic, time
 
 from gracy.replays._wrappers import record_mode, replay_mode, smart_replay_mode
 
@@ -22,7 +25,14 @@ from ._configs import (
 )
 from ._general import extract_request_kwargs
 from ._loggers import (
-    DefaultLogMessage,
+    MSG_AFTER,
+    MSG_ERRORS,
+    MSG_RETRY_AFTER,
+    MSG_RETRY_BEFORE,
+    MSG_RETRY_EXHAUSTED,
+    MSG_RETRY_TIMED_OUT,
+    MSG_THROTTLE_DONE,
+    MSG_THROTTLE_HIT,
     process_log_after_request,
     process_log_before_request,
     process_log_concurrency_freed,
@@ -52,8 +62,8 @@ from ._models import (
 )
 from ._reports._builders import ReportBuilder
 from ._reports._printers import PRINTERS, print_report
-from ._validators import AllowedStatusValidator, DefaultValidator, StrictStatusValidator
-from .exceptions import GracyParseFailed, GracyRequestFailed
+from ._validators import DEFAULT_VALIDATOR
+from .exceptions import BadResponse, GracyParseFailed, GracyRequestFailed
 from .replays.storages._base import GracyReplay
 
 if sys.version_info >= (3, 10):
@@ -71,6 +81,7 @@ P = ParamSpec("P")
 HTTP_T = t.TypeVar("HTTP_T")
 GRACEFUL_T = t.TypeVar("GRACEFUL_T", bound=ANY_COROUTINE)
 GRACEFUL_GEN_T = t.TypeVar("GRACEFUL_GEN_T", bound=t.AsyncGenerator[t.Any, t.Any])
+GRACY_T = t.TypeVar("GRACY_T", bound="Gracy[t.Any]")
 BEFORE_HOOK_TYPE = t.Callable[[GracyRequestContext], t.Awaitable[None]]
 AFTER_HOOK_TYPE = t.Callable[
     [
@@ -106,14 +117,18 @@ async def _gracefully_throttle(
                 rule, await_time = max(wait_per_rule, key=lambda x: x[1])  # type: ignore
                 if THROTTLE_LOCKER.is_rule_throttled(rule):
                     report.throttled(request_context)
-                    await asyncio.sleep(await_time)
+                    # Rather than a timer per request, wait for the one holding it
+                    if release := THROTTLE_LOCKER.wait_rule_release(rule):
+                        await asyncio.shield(release)
+                    else:
+                        await asyncio.sleep(await_time)
                     continue
 
                 with THROTTLE_LOCKER.lock_rule(rule):
                     if throttling.log_limit_reached:
                         process_log_throttle(
                             throttling.log_limit_reached,
-                            DefaultLogMessage.THROTTLE_HIT,
+                            MSG_THROTTLE_HIT,
                             await_time,
                             rule,
                             request_context,
@@ -125,7 +140,7 @@ async def _gracefully_throttle(
                     if throttling.log_wait_over:
                         process_log_throttle(
                             throttling.log_wait_over,
-                            DefaultLogMessage.THROTTLE_DONE,
+                            MSG_THROTTLE_DONE,
                             await_time,
                             rule,
                             request_context,
@@ -143,7 +158,7 @@ async def _gracefully_retry(
     after_hook: AFTER_HOOK_TYPE,
     request: GracefulRequest,
     request_context: GracyRequestContext,
-    validators: t.List[GracefulValidator],
+    validators: t.Sequence[GracefulValidator],
 ) -> GracefulRetryState:
     config = request_context.active_config
     retry = t.cast(GracefulRetry, config.retry)
@@ -152,18 +167,33 @@ async def _gracefully_retry(
     response = last_response
     resulting_exc: t.Optional[Exception] = None
 
-    failing = True
-    while failing:
-        state.increment(response)
-        if state.cant_retry:
+    loop = asyncio.get_running_loop()
+    deadline: t.Optional[float] = None
+    if retry.total_timeout is not None:
+        deadline = loop.time() + retry.total_timeout
+
+    # Loop invariants, resolved once rather than on every attempt
+    log_before = retry.log_before
+    log_after = retry.log_after
+    should_retry = config.should_retry
+    track = report.track
+
+    for _ in range(retry.max_attempts):
+        # Don't sleep just to find out there's no time left for another attempt
+        if deadline is not None and state.next_delay(response) >= (
+            deadline - loop.time()
+        ):
+            state.timed_out = True
             break
 
-        if retry.log_before:
-            process_log_retry(
-                retry.log_before, DefaultLogMessage.RETRY_BEFORE, request_context, state
-            )
+        state.increment(response)
+
+        if log_before:
+            process_log_retry(log_before, MSG_RETRY_BEFORE, request_context, state)
+
+        if state.delay > 0:
+            await sleep(state.delay)
 
-        await sleep(state.delay)
         await _gracefully_throttle(report, throttle_controller, request_context)
         throttle_controller.init_request(request_context)
 
@@ -175,11 +205,11 @@ async def _gracefully_retry(
 
         except Exception as request_err:
             resulting_exc = GracyRequestFailed(request_context, request_err)
-            report.track(request_context, request_err, start)
+            track(request_context, request_err, start)
             await after_hook(request_context, request_err, state)
 
         else:
-            report.track(request_context, response, start)
+            track(request_context, response, start)
             await after_hook(request_context, response, state)
 
         finally:
@@ -202,27 +232,33 @@ async def _gracefully_retry(
         # it should retry for cases like:
         # e.g. Allow = 404 (so it's a success),
         #      but Retry it up to 3 times to see whether it becomes 200
-        if config.should_retry(response, resulting_exc) is False:
+        if should_retry(response, resulting_exc) is False:
             state.success = True
-            failing = False
 
-        if retry.log_after:
+        if log_after:
             process_log_retry(
-                retry.log_after,
-                DefaultLogMessage.RETRY_AFTER,
+                log_after,
+                MSG_RETRY_AFTER,
                 request_context,
                 state,
                 response,
             )
 
+        if state.success:
+            break
+
+    else:
+        # Moves past the last attempt, so the state reports it can't retry anymore
+        state.increment(response)
+
     if (
         state.cant_retry
-        and config.should_retry(state.last_response, resulting_exc)
+        and should_retry(state.last_response, state.last_exc)
         and retry.log_exhausted
     ):
         process_log_retry(
             retry.log_exhausted,
-            DefaultLogMessage.RETRY_EXHAUSTED,
+            MSG_RETRY_TIMED_OUT if state.timed_out else MSG_RETRY_EXHAUSTED,
             request_context,
             state,
             response,
@@ -236,9 +272,9 @@ def _maybe_parse_result(
     request_context: GracyRequestContext,
     result: httpx.Response,
 ):
-    if active_config.parser and not isinstance(active_config.parser, Unset):
-        default_fallback = active_config.parser.get("default", UNSET_VALUE)
-        parse_result = active_config.parser.get(result.status_code, default_fallback)
+    parser = active_config.parser
+    if parser and not isinstance(parser, Unset):
+        parse_result = parser.get(result.status_code, active_config._parser_default)
 
         if not isinstance(parse_result, Unset):
             if isinstance(parse_result, type) and issubclass(parse_result, Exception):
@@ -267,14 +303,16 @@ async def _gracify(
 ):
     active_config = request_context.active_config
 
-    if isinstance(active_config.log_request, LogEvent):
-        process_log_before_request(active_config.log_request, request_context)
+    if active_config._log_request is not None:
+        process_log_before_request(active_config._log_request, request_context)
 
     resulting_exc: t.Optional[Exception] = None
 
     do_throttle = True
     if replay and replay.disable_throttling:
-        replay_available = await replay.has_replay(request.request)
+        replay_available = await replay.has_replay(
+            t.cast(httpx.Request, request.request)
+        )
         if replay_available:
             do_throttle = False
 
@@ -298,31 +336,35 @@ async def _gracify(
         report.track(request_context, response, start)
         await after_hook(request_context, response, None)
 
-    if active_config.log_response and isinstance(active_config.log_response, LogEvent):
+    if active_config._fastpath:
+        if response is not None:
+            try:
+                DEFAULT_VALIDATOR.check(response)
+            except Exception as ex:
+                resulting_exc = ex
+
+        if resulting_exc:
+            if active_config._log_errors is not None:
+                process_log_after_request(
+                    active_config._log_errors,
+                    MSG_ERRORS,
+                    request_context,
+                    response,
+                )
+
+            raise resulting_exc
+
+        return response
+
+    if active_config._log_response is not None:
         process_log_after_request(
-            active_config.log_response,
-            DefaultLogMessage.AFTER,
+            active_config._log_response,
+            MSG_AFTER,
             request_context,
             response,
         )
 
-    validators: list[GracefulValidator] = []
-    if active_config.strict_status_code and not isinstance(
-        active_config.strict_status_code, Unset
-    ):
-        validators.append(StrictStatusValidator(active_config.strict_status_code))
-    elif active_config.allowed_status_code and not isinstance(
-        active_config.allowed_status_code, Unset
-    ):
-        validators.append(AllowedStatusValidator(active_config.allowed_status_code))
-    else:
-        validators.append(DefaultValidator())
-
-    if isinstance(active_config.validators, GracefulValidator):
-        validators.append(active_config.validators)
-    elif isinstance(active_config.validators, t.Iterable):
-        validators += active_config.validators
-
+    validators = active_config.get_validators()
     if response:
         for validator in validators:
             try:
@@ -350,10 +392,10 @@ async def _gracify(
 
     did_request_fail = bool(resulting_exc)
     if did_request_fail:
-        if active_config.log_errors and isinstance(active_config.log_errors, LogEvent):
+        if active_config._log_errors is not None:
             process_log_after_request(
-                active_config.log_errors,
-                DefaultLogMessage.ERRORS,
+                active_config._log_errors,
+                MSG_ERRORS,
                 request_context,
                 response,
             )
@@ -431,6 +473,77 @@ class OngoingRequestsTracker:
             self._count -= 1
 
 
+NEGATIVE_CACHE_KEY = t.Tuple[str, str, int]
+"""Method, URL and the id of the active config"""
+
+
+class NegativeResponseCache:
+    """Remembers requests that recently failed with a bad status to fail fast"""
+
+    def __init__(self, ttl: float, max_entries: int) -> None:
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._entries: t.OrderedDict[
+            NEGATIVE_CACHE_KEY, t.Tuple[float, GracyConfig, BadResponse]
+        ] = OrderedDict()
+
+    @staticmethod
+    def make_key(request_context: GracyRequestContext) -> NEGATIVE_CACHE_KEY:
+        return (
+            request_context.method,
+            request_context.url,
+            id(request_context.active_config),
+        )
+
+    def get(
+        self, key: NEGATIVE_CACHE_KEY, active_config: GracyConfig
+    ) -> t.Optional[BadResponse]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, config, exc = entry
+        # Ids can be reused once a config is gone, so the config itself must match
+        if config is not active_config or expires_at <= monotonic():
+            del self._entries[key]
+            return None
+
+        return exc
+
+    def store(
+        self, key: NEGATIVE_CACHE_KEY, active_config: GracyConfig, exc: BadResponse
+    ) -> None:
+        self._entries[key] = (monotonic() + self._ttl, active_config, exc)
+        self._entries.move_to_end(key)
+
+        if len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+
+async def _fail_from_negative_cache(
+    report: ReportBuilder,
+    before_hook: BEFORE_HOOK_TYPE,
+    after_hook: AFTER_HOOK_TYPE,
+    request_context: GracyRequestContext,
+    cached_exc: BadResponse,
+) -> t.NoReturn:
+    """Goes through hooks, report and logs as if the cached response just came back"""
+    active_config = request_context.active_config
+    response = cached_exc.response
+
+    await before_hook(request_context)
+    report.track(request_context, response, time())
+    await after_hook(request_context, response, None)
+
+    if active_config._log_errors is not None:
+        process_log_after_request(
+            active_config._log_errors, MSG_ERRORS, request_context, response
+        )
+
+    # A fresh copy, so callers don't share (and pile tracebacks onto) one exception
+    raise copy.copy(cached_exc)
+
+
 DISABLED_GRACY_CONFIG: t.Final = GracyConfig(
     strict_status_code=None,
     allowed_status_code=None,
@@ -443,6 +556,18 @@ DISABLED_GRACY_CONFIG: t.Final = GracyConfig(
 )
 
 
+MERGED_CONFIGS_CACHE_SIZE: t.Final = 128
+
+MERGED_CONFIG_ENTRY = t.Tuple[GracyConfig, GracyConfig, t.Tuple[int, int], GracyConfig]
+"""Base config, custom config, their revisions when merged, and the merged config"""
+
+NEGATIVE_CACHE_MAX_ENTRIES: t.Final = 256
+
+DEFAULT_POOL_LIMITS: t.Final = httpx.Limits(
+    max_connections=200, max_keepalive_connections=50, keepalive_expiry=30.0
+)
+
+
 class Gracy(t.Generic[Endpoint]):
     """Helper class that provides a standard way to create an Requester using
     inheritance.
@@ -455,6 +580,9 @@ class Gracy(t.Generic[Endpoint]):
         BASE_URL: str = ""
         REQUEST_TIMEOUT: t.Optional[float] = None
         SETTINGS: GracyConfig = DEFAULT_CONFIG
+        POOL_LIMITS: httpx.Limits = DEFAULT_POOL_LIMITS
+        HTTP2: bool = False
+        NEGATIVE_CACHE_TTL: float = 0.0
 
     def __init__(
         self,
@@ -469,6 +597,15 @@ class Gracy(t.Generic[Endpoint]):
         self._client = self._create_client(**kwargs)
         self.replays = replay
         self._ongoing_tracker = OngoingRequestsTracker()
+        self._merged_configs: t.Dict[t.Tuple[int, int], MERGED_CONFIG_ENTRY] = {}
+        self._request_func_cache: t.Optional[t.Tuple[t.Any, ...]] = None
+
+        negative_cache_ttl = getattr(self.Config, "NEGATIVE_CACHE_TTL", 0.0)
+        self._negative_cache: t.Optional[NegativeResponseCache] = None
+        if negative_cache_ttl > 0:
+            self._negative_cache = NegativeResponseCache(
+                negative_cache_ttl, NEGATIVE_CACHE_MAX_ENTRIES
+            )
 
         self._post_init()
         self._init_typed_http_methods()
@@ -548,6 +685,18 @@ class Gracy(t.Generic[Endpoint]):
         self._instantiate_namespaces()
 
     def _instantiate_namespaces(self):
+        for attr_name, klass in self._get_namespace_types():
+            setattr(self, attr_name, klass(self))
+
+    def _get_namespace_types(
+        self,
+    ) -> t.Tuple[t.Tuple[str, t.Type[GracyNamespace[t.Any]]], ...]:
+        """Annotations are resolved once per class rather than on every instance"""
+        cls = type(self)
+        if (cached := cls.__dict__.get("_namespace_types")) is not None:
+            return cached
+
+        namespace_types: t.List[t.Tuple[str, t.Type[GracyNamespace[t.Any]]]] = []
         annotations = self.__annotations__
         for attr_name, attr_type in annotations.items():
             if isinstance(attr_type, str):
@@ -559,7 +708,23 @@ class Gracy(t.Generic[Endpoint]):
                 klass = None
 
             if klass and issubclass(klass, GracyNamespace):
-                setattr(self, attr_name, klass(self))
+                namespace_types.append((attr_name, klass))
+
+        cls._namespace_types = tuple(namespace_types)
+        return cls._namespace_types
+
+    async def aclose(self) -> None:
+        """Closes the httpx client, releasing its pooled connections"""
+        await self._client.aclose()
+
+        if self.replays:
+            self.replays.storage.flush()
+
+    async def __aenter__(self: GRACY_T) -> GRACY_T:
+        return self
+
+    async def __aexit__(self, *exc_info: t.Any) -> None:
+        await self.aclose()
 
     @property
     def ongoing_requests_count(self) -> int:
@@ -568,7 +733,74 @@ class Gracy(t.Generic[Endpoint]):
     def _create_client(self, **kwargs: t.Any) -> httpx.AsyncClient:
         base_url = getattr(self.Config, "BASE_URL", "")
         request_timeout = getattr(self.Config, "REQUEST_TIMEOUT", None)
-        return httpx.AsyncClient(base_url=str(base_url), timeout=request_timeout)
+        pool_limits = getattr(self.Config, "POOL_LIMITS", DEFAULT_POOL_LIMITS)
+        http2 = getattr(self.Config, "HTTP2", False)
+
+        if http2 and find_spec("h2") is None:
+            logger.warning(
+                "HTTP2 is enabled, but `h2` is not installed. Falling back to HTTP/1.1. "
+                "Install it with `pip install httpx[http2]`"
+            )
+            http2 = False
+
+        return httpx.AsyncClient(
+            base_url=str(base_url),
+            timeout=request_timeout,
+            limits=pool_limits,
+            http2=http2,
+        )
+
+    def _get_merged_config(self, custom_config: GracyConfig) -> GracyConfig:
+        """
+        Custom configs usually come from decorators, so the same few get merged with
+        the base config over and over.
+        """
+        base_config = self._base_config
+        key = (id(base_config), id(custom_config))
+
+        revisions = (base_config._revision, custom_config._revision)
+
+        # Objects are kept in the entry, so ids can't be reused while it's cached
+        cached = self._merged_configs.get(key)
+        if cached is not None and cached[2] == revisions:
+            return cached[3]
+
+        if len(self._merged_configs) >= MERGED_CONFIGS_CACHE_SIZE:
+            self._merged_configs.clear()
+
+        merged = GracyConfig.merge_config(base_config, custom_config)
+        self._merged_configs[key] = (base_config, custom_config, revisions, merged)
+        return merged
+
+    def _get_request_func(self) -> t.Callable[..., t.Awaitable[httpx.Response]]:
+        """Wraps the client for replays once, rather than on every request"""
+        client = self._client
+        replays = self.replays
+        mode = replays.mode if replays else None
+
+        # Rebuilt whenever the client or replays get swapped (e.g. mocked in tests)
+        if cached := self._request_func_cache:
+            cached_client, cached_replays, cached_mode, cached_func = cached
+            if (
+                cached_client is client
+                and cached_replays is replays
+                and cached_mode == mode
+            ):
+                return cached_func
+
+        httpx_request_func = client.request
+        if replays:
+            if mode == "record":
+                httpx_request_func = record_mode(replays, httpx_request_func)
+            elif mode == "replay":
+                httpx_request_func = replay_mode(replays, client, httpx_request_func)
+            else:
+                httpx_request_func = smart_replay_mode(
+                    replays, client, httpx_request_func
+                )
+
+        self._request_func_cache = (client, replays, mode, httpx_request_func)
+        return httpx_request_func
 
     async def _request(
         self,
@@ -581,32 +813,39 @@ class Gracy(t.Generic[Endpoint]):
         custom_config = custom_config_context.get()
         active_config = self._base_config
         if custom_config:
-            active_config = GracyConfig.merge_config(self._base_config, custom_config)
+            active_config = self._get_merged_config(custom_config)
 
         if self.DEBUG_ENABLED:
-            logger.debug(f"Active Config for {endpoint}: {active_config}")
+            logger.debug("Active Config for %s: %s", endpoint, active_config)
 
         request_context = GracyRequestContext(
             method, str(self._client.base_url), endpoint, endpoint_args, active_config
         )
 
-        httpx_request_func = self._client.request
-        if replays := self.replays:
-            if replays.mode == "record":
-                httpx_request_func = record_mode(replays, httpx_request_func)
-            elif replays.mode == "replay":
-                httpx_request_func = replay_mode(
-                    replays, self._client, httpx_request_func
-                )
-            else:
-                httpx_request_func = smart_replay_mode(
-                    replays, self._client, httpx_request_func
+        # Only plain requests are cached, since extra args (e.g. params) change them
+        negative_cache = self._negative_cache
+        negative_key: t.Optional[NEGATIVE_CACHE_KEY] = None
+        if negative_cache is not None and not args and not kwargs:
+            negative_key = negative_cache.make_key(request_context)
+            if cached_exc := negative_cache.get(negative_key, active_config):
+                await _fail_from_negative_cache(
+                    Gracy._reporter,
+                    self._before,
+                    self._after,
+                    request_context,
+                    cached_exc,
                 )
 
-        request_kwargs = extract_request_kwargs(kwargs)
-        request = self._client.build_request(
-            request_context.method, request_context.endpoint, **request_kwargs
-        )
+        replays = self.replays
+        httpx_request_func = self._get_request_func()
+
+        # Only replays need the request upfront (to check whether it was recorded)
+        request: t.Optional[httpx.Request] = None
+        if replays:
+            request_kwargs = extract_request_kwargs(kwargs)
+            request = self._client.build_request(
+                request_context.method, request_context.endpoint, **request_kwargs
+            )
 
         graceful_request = _gracify(
             Gracy._reporter,
@@ -628,7 +867,15 @@ class Gracy(t.Generic[Endpoint]):
         concurrent = active_config.get_concurrent_limit(request_context)
 
         async with self._ongoing_tracker.request(request_context, concurrent):
-            return await graceful_request
+            if negative_cache is None or negative_key is None:
+                return await graceful_request
+
+            try:
+                return await graceful_request
+            except BadResponse as ex:
+                if ex.response.status_code >= 400:
+                    negative_cache.store(negative_key, active_config, ex)
+                raise
 
     async def before(self, context: GracyRequestContext):
         ...
@@ -692,6 +939,9 @@ class GracyNamespace(t.Generic[Endpoint], Gracy[Endpoint]):
         self.replays = parent.replays
         self._parent = parent
         self._ongoing_tracker = parent._ongoing_tracker
+        self._merged_configs = {}
+        self._request_func_cache = None
+        self._negative_cache = parent._negative_cache
 
         self._init_typed_http_methods()
         self._client = self._get_namespace_client(parent, **kwargs)
@@ -778,9 +1028,13 @@ def graceful(
         wrapped_function: t.Callable[P, GRACEFUL_T],
     ) -> t.Callable[P, GRACEFUL_T]:
         async def _inner_wrapper(*args: P.args, **kwargs: P.kwargs):
-            with custom_gracy_config(config):
-                res = await wrapped_function(*args, **kwargs)
-                return res
+            # Same as custom_gracy_config() minus the context manager. A coroutine
+            # always resumes in its own context, so reset() can't fail here
+            token = custom_config_context.set(config)
+            try:
+                return await wrapped_function(*args, **kwargs)
+            finally:
+                custom_config_context.reset(token)
 
         return t.cast(t.Callable[P, GRACEFUL_T], _inner_wrapper)
 
@@ -3,7 +3,8 @@ from __future__ import annotations
 import httpx
 import logging
 import typing as t
-from enum import Enum
+from functools import lru_cache
+from string import Formatter
 
 from ._models import GracefulRetryState, GracyRequestContext, LogEvent, ThrottleRule
 
@@ -19,63 +20,141 @@ class SafeDict(t.Dict[str, str]):
         return "{" + key + "}"
 
 
-class DefaultLogMessage(str, Enum):
-    BEFORE = "Request on {URL} is ongoing"
-    AFTER = "{REPLAY}[{METHOD}] {URL} returned {STATUS}"
-    ERRORS = "[{METHOD}] {URL} returned a bad status ({STATUS})"
+class LogTemplate:
+    """
+    A `str.format` message parsed once into an equivalent `%`-style template,
+    so rendering it doesn't re-parse the placeholders every time.
 
-    THROTTLE_HIT = "{URL} hit {THROTTLE_LIMIT} reqs/{THROTTLE_TIME_RANGE}"
-    THROTTLE_DONE = "Done waiting {THROTTLE_TIME}s to hit {URL}"
+    Templates using format specs, conversions, or attribute/index lookups are
+    rendered with `str.format_map` as usual.
+    """
 
-    RETRY_BEFORE = (
-        "GracefulRetry: {URL} will wait {RETRY_DELAY}s before next attempt due to "
-        "{RETRY_CAUSE} ({CUR_ATTEMPT} out of {MAX_ATTEMPT})"
-    )
-    RETRY_AFTER = (
-        "GracefulRetry: {URL} replied {STATUS} ({CUR_ATTEMPT} out of {MAX_ATTEMPT})"
-    )
-    RETRY_EXHAUSTED = "GracefulRetry: {URL} exhausted the maximum attempts of {MAX_ATTEMPT} due to {RETRY_CAUSE}"
+    __slots__ = ("template", "_percent_template")
 
-    REPLAY_RECORDED = "Gracy Replay: Recorded {RECORDED_COUNT} requests"
-    REPLAY_REPLAYED = "Gracy Replay: Replayed {REPLAYED_COUNT} requests"
+    def __init__(self, template: str) -> None:
+        self.template = template
+        self._percent_template: str | None = ""
 
-    CONCURRENT_REQUEST_LIMIT_HIT = (
-        "{UURL} hit {CONCURRENT_REQUESTS} ongoing concurrent requests"
-    )
-    CONCURRENT_REQUEST_LIMIT_FREED = "{UURL} concurrency has been freed"
+        for literal, field, spec, conversion in Formatter().parse(template):
+            self._percent_template += literal.replace("%", "%%")
+            if field is None:
+                continue
+
+            if spec or conversion or not field.isidentifier():
+                self._percent_template = None
+                break
+
+            self._percent_template += f"%({field})s"
+
+    def format_map(self, mapping: t.Mapping[str, t.Any]) -> str:
+        if self._percent_template is None:
+            return self.template.format_map(mapping)
+
+        return self._percent_template % mapping
+
+    def __str__(self) -> str:
+        return self.template
+
+    def __repr__(self) -> str:
+        return f"LogTemplate({self.template!r})"
+
+
+@lru_cache(maxsize=128)
+def _get_log_template(message: str) -> LogTemplate:
+    """Custom messages come from a handful of LogEvents, so parse each once"""
+    return LogTemplate(message)
+
+
+MSG_BEFORE: t.Final = LogTemplate("Request on {URL} is ongoing")
+MSG_AFTER: t.Final = LogTemplate("{REPLAY}[{METHOD}] {URL} returned {STATUS}")
+MSG_ERRORS: t.Final = LogTemplate("[{METHOD}] {URL} returned a bad status ({STATUS})")
+
+MSG_THROTTLE_HIT: t.Final = LogTemplate(
+    "{URL} hit {THROTTLE_LIMIT} reqs/{THROTTLE_TIME_RANGE}"
+)
+MSG_THROTTLE_DONE: t.Final = LogTemplate("Done waiting {THROTTLE_TIME}s to hit {URL}")
+
+MSG_RETRY_BEFORE: t.Final = LogTemplate(
+    "GracefulRetry: {URL} will wait {RETRY_DELAY}s before next attempt due to "
+    "{RETRY_CAUSE} ({CUR_ATTEMPT} out of {MAX_ATTEMPT})"
+)
+MSG_RETRY_AFTER: t.Final = LogTemplate(
+    "GracefulRetry: {URL} replied {STATUS} ({CUR_ATTEMPT} out of {MAX_ATTEMPT})"
+)
+MSG_RETRY_EXHAUSTED: t.Final = LogTemplate(
+    "GracefulRetry: {URL} exhausted the maximum attempts of {MAX_ATTEMPT} due to "
+    "{RETRY_CAUSE}"
+)
+MSG_RETRY_TIMED_OUT: t.Final = LogTemplate(
+    "GracefulRetry: {URL} ran out of its total timeout after {CUR_ATTEMPT} out of "
+    "{MAX_ATTEMPT} attempts due to {RETRY_CAUSE}"
+)
+
+MSG_REPLAY_RECORDED: t.Final = LogTemplate(
+    "Gracy Replay: Recorded {RECORDED_COUNT} requests"
+)
+MSG_REPLAY_REPLAYED: t.Final = LogTemplate(
+    "Gracy Replay: Replayed {REPLAYED_COUNT} requests"
+)
+
+MSG_CONCURRENT_REQUEST_LIMIT_HIT: t.Final = LogTemplate(
+    "{UURL} hit {CONCURRENT_REQUESTS} ongoing concurrent requests"
+)
+MSG_CONCURRENT_REQUEST_LIMIT_FREED: t.Final = LogTemplate(
+    "{UURL} concurrency has been freed"
+)
 
 
 def do_log(
     logevent: LogEvent,
-    defaultmsg: str,
+    defaultmsg: str | LogTemplate,
     format_args: dict[str, t.Any],
     response: httpx.Response | None = None,
 ):
+    if not logger.isEnabledFor(logevent.level):
+        return
+
     # Let's protect ourselves against potential customizations with undefined {key}
-    safe_format_args = SafeDict(**format_args)
+    if isinstance(format_args, SafeDict):
+        safe_format_args = format_args
+    else:
+        safe_format_args = SafeDict(format_args)
 
     if logevent.custom_message:
         if isinstance(logevent.custom_message, str):
-            message = logevent.custom_message.format_map(safe_format_args)
+            template = _get_log_template(logevent.custom_message)
+            message = template.format_map(safe_format_args)
         else:
             message = logevent.custom_message(response).format_map(safe_format_args)
     else:
+        if not isinstance(defaultmsg, LogTemplate):
+            defaultmsg = _get_log_template(defaultmsg)
+
         message = defaultmsg.format_map(safe_format_args)
 
     logger.log(logevent.level, message, extra=format_args)
 
 
 def extract_base_format_args(request_context: GracyRequestContext) -> dict[str, str]:
-    return dict(
-        URL=request_context.url,
-        ENDPOINT=request_context.endpoint,
-        UURL=request_context.unformatted_url,
-        UENDPOINT=request_context.unformatted_endpoint,
-        METHOD=request_context.method,
-    )
+    """Returns a fresh dict that callers are free to extend with their own keys"""
+    format_args = SafeDict()
+    format_args["URL"] = request_context.url
+    format_args["ENDPOINT"] = request_context.endpoint
+    format_args["UURL"] = request_context.unformatted_url
+    format_args["UENDPOINT"] = request_context.unformatted_endpoint
+    format_args["METHOD"] = request_context.method
+    return format_args
 
 
 def extract_response_format_args(response: httpx.Response | None) -> dict[str, str]:
+    format_args: dict[str, str] = {}
+    add_response_format_args(format_args, response)
+    return format_args
+
+
+def add_response_format_args(
+    format_args: dict[str, str], response: httpx.Response | None
+) -> None:
     status_code = response.status_code if response else "ABORTED"
     elapsed = response.elapsed if response else "UNKNOWN"
 
@@ -86,71 +165,73 @@ def extract_response_format_args(response: httpx.Response | None) -> dict[str, s
         replayed = "FALSE"
         replayed_str = ""
 
-    return dict(
-        STATUS=str(status_code),
-        ELAPSED=str(elapsed),
-        IS_REPLAY=replayed,
-        REPLAY=replayed_str,
-    )
+    format_args["STATUS"] = str(status_code)
+    format_args["ELAPSED"] = str(elapsed)
+    format_args["IS_REPLAY"] = replayed
+    format_args["REPLAY"] = replayed_str
 
 
 def process_log_before_request(
     logevent: LogEvent, request_context: GracyRequestContext
 ) -> None:
+    if not logger.isEnabledFor(logevent.level):
+        return
+
     format_args = extract_base_format_args(request_context)
-    do_log(logevent, DefaultLogMessage.BEFORE, format_args)
+    do_log(logevent, MSG_BEFORE, format_args)
 
 
 def process_log_throttle(
     logevent: LogEvent,
-    default_message: str,
+    default_message: str | LogTemplate,
     await_time: float,
     rule: ThrottleRule,
     request_context: GracyRequestContext,
 ):
-    format_args = dict(
-        **extract_base_format_args(request_context),
-        THROTTLE_TIME=await_time,
-        THROTTLE_LIMIT=rule.max_requests,
-        THROTTLE_TIME_RANGE=rule.readable_time_range,
-    )
+    if not logger.isEnabledFor(logevent.level):
+        return
+
+    format_args: t.Dict[str, t.Any] = extract_base_format_args(request_context)
+    format_args["THROTTLE_TIME"] = await_time
+    format_args["THROTTLE_LIMIT"] = rule.max_requests
+    format_args["THROTTLE_TIME_RANGE"] = rule.readable_time_range
 
     do_log(logevent, default_message, format_args)
 
 
 def process_log_retry(
     logevent: LogEvent,
-    defaultmsg: str,
+    defaultmsg: str | LogTemplate,
     request_context: GracyRequestContext,
     state: GracefulRetryState,
     response: httpx.Response | None = None,
 ):
-    maybe_response_args: dict[str, str] = {}
+    if not logger.isEnabledFor(logevent.level):
+        return
+
+    format_args: t.Dict[str, t.Any] = extract_base_format_args(request_context)
     if response:
-        maybe_response_args = extract_response_format_args(response)
+        add_response_format_args(format_args, response)
 
-    format_args = dict(
-        **extract_base_format_args(request_context),
-        **maybe_response_args,
-        RETRY_DELAY=state.delay,
-        RETRY_CAUSE=state.cause,
-        CUR_ATTEMPT=state.cur_attempt,
-        MAX_ATTEMPT=state.max_attempts,
-    )
+    format_args["RETRY_DELAY"] = state.delay
+    format_args["RETRY_CAUSE"] = state.cause
+    format_args["CUR_ATTEMPT"] = state.cur_attempt
+    format_args["MAX_ATTEMPT"] = state.max_attempts
 
     do_log(logevent, defaultmsg, format_args, response)
 
 
 def process_log_after_request(
     logevent: LogEvent,
-    defaultmsg: str,
+    defaultmsg: str | LogTemplate,
     request_context: GracyRequestContext,
     response: httpx.Response | None,
 ) -> None:
-    format_args: dict[str, str] = dict(
-        **extract_base_format_args(request_context),
-        **extract_response_format_args(response),
-    )
+    if not logger.isEnabledFor(logevent.level):
+        return
+
+    format_args = extract_base_format_args(request_context)
+    add_response_format_args(format_args, response)
 
     do_log(logevent, defaultmsg, format_args, response)
 
@@ -158,18 +239,20 @@ def process_log_after_request(
 def process_log_concurrency_limit(
     logevent: LogEvent, count: int, request_context: GracyRequestContext
 ):
-    format_args: t.Dict[str, str] = dict(
-        CONCURRENT_REQUESTS=f"{count:,}",
-        **extract_base_format_args(request_context),
-    )
+    if not logger.isEnabledFor(logevent.level):
+        return
 
-    do_log(logevent, DefaultLogMessage.CONCURRENT_REQUEST_LIMIT_HIT, format_args)
+    format_args = extract_base_format_args(request_context)
+    format_args["CONCURRENT_REQUESTS"] = f"{count:,}"
+
+    do_log(logevent, MSG_CONCURRENT_REQUEST_LIMIT_HIT, format_args)
 
 
 def process_log_concurrency_freed(
     logevent: LogEvent, request_context: GracyRequestContext
 ):
-    format_args: t.Dict[str, str] = dict(
-        **extract_base_format_args(request_context),
-    )
-    do_log(logevent, DefaultLogMessage.CONCURRENT_REQUEST_LIMIT_FREED, format_args)
+    if not logger.isEnabledFor(logevent.level):
+        return
+
+    format_args = extract_base_format_args(request_context)
+    do_log(logevent, MSG_CONCURRENT_REQUEST_LIMIT_FREED, format_args)
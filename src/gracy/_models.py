@@ -9,14 +9,17 @@ import logging
 import re
 import typing as t
 from abc import ABC, abstractmethod
+from collections import deque
 from contextlib import contextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from datetime import datetime, timedelta
 from enum import Enum, IntEnum
+from functools import lru_cache, partial
 from http import HTTPStatus
 from threading import Lock
+from time import monotonic
 
-from ._types import PARSER_TYPE, UNSET_VALUE, Unset
+from ._types import PARSER_TYPE, PARSER_VALUE, UNSET_VALUE, Unset
 
 
 class LogLevel(IntEnum):
@@ -48,13 +51,37 @@ LOG_EVENT_TYPE = t.Union[None, Unset, LogEvent]
 
 
 class GracefulRetryState:
-    cur_attempt: int = 0
-    success: bool = False
-
-    last_exc: Exception | None = None
+    __slots__ = (
+        "cur_attempt",
+        "success",
+        "last_exc",
+        "last_response",
+        "max_attempts",
+        "_retry_config",
+        "_delay",
+        "_override_delay",
+        "timed_out",
+    )
+
+    cur_attempt: int
+    success: bool
+
+    last_exc: Exception | None
     last_response: httpx.Response | None
 
+    max_attempts: int
+
+    timed_out: bool
+    """Whether `total_timeout` ended retries before `max_attempts` were made"""
+
     def __init__(self, retry_config: GracefulRetry) -> None:
+        self.cur_attempt = 0
+        self.success = False
+        self.last_exc = None
+        self.last_response = None
+        self.max_attempts = retry_config.max_attempts
+        self.timed_out = False
+
         self._retry_config = retry_config
         self._delay = retry_config.delay
         self._override_delay: float | None = None
@@ -70,13 +97,9 @@ class GracefulRetryState:
     def failed(self) -> bool:
         return not self.success
 
-    @property
-    def max_attempts(self):
-        return self._retry_config.max_attempts
-
     @property
     def can_retry(self):
-        return self.cur_attempt <= self.max_attempts
+        return not self.timed_out and self.cur_attempt <= self.max_attempts
 
     @property
     def cant_retry(self):
@@ -116,24 +139,31 @@ class GracefulRetryState:
         resp = t.cast(httpx.Response, self.last_response)
         return f"[Bad Status Code: {resp.status_code}]"
 
-    def increment(self, response: httpx.Response | None):
-        self.cur_attempt += 1
+    def _get_next_delays(
+        self, response: httpx.Response | None
+    ) -> tuple[float, float | None]:
+        delay = self._retry_config._delay_for(self.cur_attempt)
 
-        if self.cur_attempt > 1:
-            self._delay *= self._retry_config.delay_modifier
+        override_delay = None
+        overrides = self._retry_config.overrides
+        if response and overrides and overrides.get(response.status_code):
+            override_delay = overrides[response.status_code].delay
 
-        self._override_delay = None
-        if (
-            response
-            and self._retry_config.overrides
-            and self._retry_config.overrides.get(response.status_code)
-        ):
-            self._override_delay = self._retry_config.overrides[
-                response.status_code
-            ].delay
+        return delay, override_delay
+
+    def next_delay(self, response: httpx.Response | None) -> float:
+        """How long `increment` would make the next attempt wait, without moving to it"""
+        delay, override_delay = self._get_next_delays(response)
+        return delay if override_delay is None else override_delay
+
+    def increment(self, response: httpx.Response | None):
+        self._delay, self._override_delay = self._get_next_delays(response)
+        self.cur_attempt += 1
 
 
 STATUS_OR_EXCEPTION = t.Union[int, t.Type[Exception]]
+_SINGLE_RETRY_ON: t.Final = (int, type)
+"""Types of a lone `retry_on` value, rather than a collection of them"""
 
 
 @dataclass
@@ -141,6 +171,12 @@ class OverrideRetryOn:
     delay: float
 
 
+_PRECOMPUTED_DELAYS: t.Final = 32
+"""How many attempt delays are kept up front, later ones are computed when reached"""
+
+_RETRY_DERIVED_FROM: t.Final = frozenset(("delay", "max_attempts", "delay_modifier"))
+
+
 @dataclass
 class GracefulRetry:
     delay: float
@@ -153,16 +189,49 @@ class GracefulRetry:
     log_exhausted: LogEvent | None = None
     behavior: t.Literal["break", "pass"] = "break"
     overrides: t.Union[t.Dict[int, OverrideRetryOn], None] = None
+    total_timeout: float | None = None
+    """Maximum seconds to spend retrying, no attempt starts after it's over"""
+
+    def __post_init__(self) -> None:
+        self._refresh_derived()
+
+    def __setattr__(self, name: str, value: t.Any) -> None:
+        super().__setattr__(name, value)
+
+        # Keeps precomputed values right even if it's changed after creation
+        if name in _RETRY_DERIVED_FROM and "_delays" in self.__dict__:
+            self._refresh_derived()
+
+    def _refresh_derived(self) -> None:
+        # The delay for the first attempts, precomputed since they rarely change
+        delays: list[float] = []
+        delay = self.delay
+        for attempt in range(min(self.max_attempts, _PRECOMPUTED_DELAYS)):
+            if attempt > 0:
+                delay *= self.delay_modifier
+            delays.append(delay)
+
+        self._delays = tuple(delays)
+
+    def _delay_for(self, attempt: int) -> float:
+        """Delay before `attempt` (0 based), anything past the last attempt keeps its delay"""
+        attempt = max(0, min(attempt, self.max_attempts - 1))
+        if attempt < len(self._delays):
+            return self._delays[attempt]
+
+        return self.delay * self.delay_modifier**attempt
+
+    def _retries_on_status(self, status: int) -> bool:
+        """Read from `retry_on` as is, so codes added to it later are honored"""
+        retry_on = self.retry_on
+        if isinstance(retry_on, int):
+            return retry_on == status
+        if retry_on is None or inspect.isclass(retry_on):
+            return False
+        return status in retry_on
 
     def needs_retry(self, response_result: int) -> bool:
-        if self.retry_on is None:
-            return True
-
-        retry_on_status = self.retry_on
-        if not isinstance(retry_on_status, t.Iterable):
-            retry_on_status = {retry_on_status}
-
-        return response_result in retry_on_status
+        return self.retry_on is None or self._retries_on_status(response_result)
 
     def create_state(
         self, result: httpx.Response | None, exc: Exception | None
@@ -173,6 +242,12 @@ class GracefulRetry:
         return state
 
 
+@lru_cache(maxsize=1024)
+def _url_matches(url_pattern: t.Pattern[str], url: str) -> bool:
+    """Clients keep hitting the same URLs, so each pattern only runs once per URL"""
+    return url_pattern.match(url) is not None
+
+
 class ThrottleRule:
     url_pattern: t.Pattern[str]
     """
@@ -238,6 +313,9 @@ class ThrottleRule:
     def __str__(self) -> str:
         return f"{self.max_requests} requests per {self.readable_time_range} for URLs matching {self.url_pattern}"
 
+    def matches(self, url: str) -> bool:
+        return _url_matches(self.url_pattern, url)
+
     def calculate_await_time(self, controller: ThrottleController) -> float:
         """
         Checks current reqs/second and awaits if limit is reached.
@@ -256,15 +334,48 @@ class ThrottleRule:
         return 0.0
 
 
+def _resolve_release(release: asyncio.Future[None]) -> None:
+    if not release.done():
+        release.set_result(None)
+
+
 class ThrottleLocker:
     def __init__(self) -> None:
         self._regex_lock = t.DefaultDict[t.Pattern[str], Lock](Lock)
         self._generic_lock = Lock()
+        self._releases: t.Dict[t.Pattern[str], asyncio.Future[None]] = {}
 
     @contextmanager
     def lock_rule(self, rule: ThrottleRule):
-        with self._regex_lock[rule.url_pattern] as lock:
-            yield lock
+        try:
+            with self._regex_lock[rule.url_pattern] as lock:
+                yield lock
+        finally:
+            # Only after unlocking, so no waiter can sneak in a future nobody resolves
+            with self._generic_lock:
+                release = self._releases.pop(rule.url_pattern, None)
+
+            if release is not None and not release.get_loop().is_closed():
+                release.get_loop().call_soon_threadsafe(_resolve_release, release)
+
+    def wait_rule_release(self, rule: ThrottleRule) -> asyncio.Future[None] | None:
+        """
+        Returns a future shared by every request waiting for `rule` to be unlocked,
+        or `None` if it's not locked (anymore) or is awaited within another event loop.
+        """
+        loop = asyncio.get_running_loop()
+
+        with self._generic_lock:
+            if not self._regex_lock[rule.url_pattern].locked():
+                return None
+
+            release = self._releases.get(rule.url_pattern)
+            if release is None:
+                release = self._releases[rule.url_pattern] = loop.create_future()
+            elif release.get_loop() is not loop:
+                return None
+
+            return release
 
     @contextmanager
     def lock_check(self):
@@ -279,63 +390,85 @@ THROTTLE_LOCKER: t.Final = ThrottleLocker()
 
 
 class GracefulThrottle:
-    rules: list[ThrottleRule] = []
+    rules: tuple[ThrottleRule, ...] = ()
     log_limit_reached: LogEvent | None = None
     log_wait_over: LogEvent | None = None
 
     def __init__(
         self,
-        rules: list[ThrottleRule] | ThrottleRule,
+        rules: t.Iterable[ThrottleRule] | ThrottleRule,
         log_limit_reached: LogEvent | None = None,
         log_wait_over: LogEvent | None = None,
     ) -> None:
-        self.rules = rules if isinstance(rules, t.Iterable) else [rules]
+        # Checked on every request, so it's stored as a tuple that can't be exhausted
+        self.rules = (rules,) if isinstance(rules, ThrottleRule) else tuple(rules)
         self.log_limit_reached = log_limit_reached
         self.log_wait_over = log_wait_over
 
 
 class ThrottleController:
     def __init__(self) -> None:
-        self._control = t.DefaultDict[str, t.List[datetime]](list)
+        # Request start times in `monotonic()` seconds, immune to wall-clock changes
+        self._control = t.DefaultDict[str, t.List[float]](list)
+        # Sliding windows of recent request times per (pattern, range), kept up to date
+        # by `init_request` so checking a rule doesn't rescan the whole history
+        self._windows: t.Dict[t.Tuple[t.Pattern[str], float], t.Deque[float]] = {}
+        # Windows each URL feeds into, dropped whenever a new window shows up
+        self._url_windows: t.Dict[str, t.List[t.Deque[float]]] = {}
 
     def init_request(self, request_context: GracyRequestContext):
+        url = request_context.url
+        now = monotonic()
+
         with THROTTLE_LOCKER.lock_check():
-            self._control[request_context.url].append(
-                datetime.now()
-            )  # This should always keep it sorted asc
+            self._control[url].append(now)  # This should always keep it sorted asc
+
+            windows = self._url_windows.get(url)
+            if windows is None:
+                windows = self._url_windows[url] = [
+                    window
+                    for (url_pattern, _), window in self._windows.items()
+                    if _url_matches(url_pattern, url)
+                ]
+
+            for window in windows:
+                window.append(now)
+
+    def _build_window(
+        self, url_pattern: t.Pattern[str], past_time_window: float
+    ) -> t.Deque[float]:
+        return deque(
+            sorted(
+                started_at
+                for url, started_ats in self._control.items()
+                if _url_matches(url_pattern, url)
+                for started_at in started_ats
+                if started_at >= past_time_window
+            )
+        )
 
     def calculate_requests_per_rule(
         self, url_pattern: t.Pattern[str], range: timedelta
     ) -> float:
-        with THROTTLE_LOCKER.lock_check():
-            past_time_window = datetime.now() - range
-            request_rate = 0.0
+        range_seconds = range.total_seconds()
 
-            request_times = sorted(
-                itertools.chain(
-                    *[
-                        started_ats
-                        for url, started_ats in self._control.items()
-                        if url_pattern.match(url)
-                    ],
-                ),
-                reverse=True,
-            )
+        with THROTTLE_LOCKER.lock_check():
+            past_time_window = monotonic() - range_seconds
 
-            req_idx = 0
-            total_reqs = len(request_times)
-            while req_idx < total_reqs:
-                # e.g. Limit 4 requests per 2 seconds, now is 09:55
-                # request_time=09:54 >= past_time_window=09:53
-                if request_times[req_idx] >= past_time_window:
-                    request_rate += 1
-                else:
-                    # Because it's sorted desc there's no need to keep iterating
-                    return request_rate
+            key = (url_pattern, range_seconds)
+            window = self._windows.get(key)
+            if window is None:
+                window = self._windows[key] = self._build_window(
+                    url_pattern, past_time_window
+                )
+                self._url_windows.clear()
 
-                req_idx += 1
+            # e.g. Limit 4 requests per 2 seconds, now is 09:55
+            # request_time=09:52 < past_time_window=09:53 is no longer counted
+            while window and window[0] < past_time_window:
+                window.popleft()
 
-            return request_rate
+            return float(len(window))
 
     def calculate_requests_per_sec(self, url_pattern: t.Pattern[str]) -> float:
         with THROTTLE_LOCKER.lock_check():
@@ -345,7 +478,7 @@ class ThrottleController:
                     *[
                         started_ats
                         for url, started_ats in self._control.items()
-                        if url_pattern.match(url)
+                        if _url_matches(url_pattern, url)
                     ]
                 )
             )
@@ -355,13 +488,13 @@ class ThrottleController:
                 last = (
                     coalesced_started_ats[-1]
                     if len(coalesced_started_ats) > 1
-                    else datetime.now()
+                    else monotonic()
                 )
                 start = coalesced_started_ats[0]
-                elapsed = last - start
+                elapsed_seconds = int(last - start)
 
-                if elapsed.seconds > 0:
-                    requests_per_second = len(coalesced_started_ats) / elapsed.seconds
+                if elapsed_seconds > 0:
+                    requests_per_second = len(coalesced_started_ats) / elapsed_seconds
 
             return requests_per_second
 
@@ -376,8 +509,12 @@ class ThrottleController:
         table.add_column("Count", justify="right")
         table.add_column("Times", justify="right")
 
+        wall_clock_offset = datetime.now().timestamp() - monotonic()
         for url, times in self._control.items():
-            human_times = [time.strftime("%H:%M:%S.%f") for time in times]
+            human_times = [
+                datetime.fromtimestamp(time + wall_clock_offset).strftime("%H:%M:%S.%f")
+                for time in times
+            ]
             table.add_row(url, f"{len(times):,}", f"[yellow]{human_times}[/yellow]")
 
         console.print(table)
@@ -484,6 +621,10 @@ class ConcurrentRequestLimit:
         return self._arg_semaphore_map[key]
 
 
+def _as_log_event(log_event: LOG_EVENT_TYPE) -> LogEvent | None:
+    return log_event if isinstance(log_event, LogEvent) else None
+
+
 CONCURRENT_REQUEST_TYPE = t.Union[
     t.Iterable[ConcurrentRequestLimit], ConcurrentRequestLimit, None, Unset
 ]
@@ -536,19 +677,90 @@ class GracyConfig:
 
     concurrent_requests: CONCURRENT_REQUEST_TYPE = UNSET_VALUE
 
+    def __post_init__(self) -> None:
+        self._refresh_derived()
+
+    def __setattr__(self, name: str, value: t.Any) -> None:
+        super().__setattr__(name, value)
+
+        # Keeps precomputed values right even if it's changed after creation
+        if name in _CONFIG_FIELDS and "_fastpath" in self.__dict__:
+            self._refresh_derived()
+
+    def _refresh_derived(self) -> None:
+        """Precomputes what's read on every request"""
+        # Lets caches built on top of this config (e.g. merges) tell it changed
+        self._revision: int = self.__dict__.get("_revision", 0) + 1
+
+        self._log_request = _as_log_event(self.log_request)
+        self._log_response = _as_log_event(self.log_response)
+        self._log_errors = _as_log_event(self.log_errors)
+
+        self._parser_default: PARSER_VALUE | Unset = UNSET_VALUE
+        if self.parser and not isinstance(self.parser, Unset):
+            self._parser_default = self.parser.get("default", UNSET_VALUE)
+
+        self._has_retry = self.retry is not None and not isinstance(self.retry, Unset)
+        self._all_unset = all(
+            isinstance(getattr(self, key), Unset) for key in _CONFIG_FIELDS
+        )
+
+        # Built on first use, since validators can't be imported while this loads
+        self._validators: tuple[GracefulValidator, ...] | None = None
+
+        # Nothing to validate, retry, or parse besides the default status check, and
+        # errors are the only thing that might get logged after the request
+        self._fastpath = all(
+            value is None or isinstance(value, Unset)
+            for value in (
+                self.log_response,
+                self.retry,
+                self.strict_status_code,
+                self.allowed_status_code,
+                self.validators,
+                self.parser,
+            )
+        )
+
+    def get_validators(self) -> tuple[GracefulValidator, ...]:
+        """Status code validator followed by the custom ones, in the order they run"""
+        if self._validators is not None:
+            return self._validators
+
+        # Importing here to avoid cyclic imports
+        from ._validators import (
+            DEFAULT_VALIDATOR,
+            AllowedStatusValidator,
+            StrictStatusValidator,
+        )
+
+        validators: list[GracefulValidator] = []
+        if self.strict_status_code:
+            validators.append(StrictStatusValidator(self.strict_status_code))
+        elif self.allowed_status_code:
+            validators.append(AllowedStatusValidator(self.allowed_status_code))
+        else:
+            validators.append(DEFAULT_VALIDATOR)
+
+        if isinstance(self.validators, GracefulValidator):
+            validators.append(self.validators)
+        elif isinstance(self.validators, t.Iterable):
+            validators += self.validators
+
+        self._validators = tuple(validators)
+        return self._validators
+
     def should_retry(
         self, response: httpx.Response | None, req_or_validation_exc: Exception | None
     ) -> bool:
         """Only checks if given status requires retry. Does not consider attempts."""
 
-        if self.has_retry:
+        if self._has_retry:
             retry = t.cast(GracefulRetry, self.retry)
 
+            # Cheaper than isinstance(..., t.Iterable), which goes through the ABC
             retry_on: t.Iterable[STATUS_OR_EXCEPTION]
-            if (
-                not isinstance(retry.retry_on, t.Iterable)
-                and retry.retry_on is not None
-            ):
+            if isinstance(retry.retry_on, _SINGLE_RETRY_ON):
                 retry_on = [retry.retry_on]
             elif retry.retry_on is None:
                 retry_on = []
@@ -577,41 +789,43 @@ class GracyConfig:
             response_status = response.status_code
 
             if retry.retry_on is None:
-                if req_or_validation_exc or response.is_success is False:
-                    return True
-
-            if isinstance(retry.retry_on, t.Iterable):
-                if response_status in retry.retry_on:
+                # Same as `response.is_success`, without going through the property
+                if req_or_validation_exc or not 200 <= response_status < 300:
                     return True
 
-                for maybe_exc in retry.retry_on:
-                    if inspect.isclass(maybe_exc) and isinstance(
-                        req_or_validation_exc, maybe_exc
-                    ):
-                        return True
+            if retry._retries_on_status(response_status):
+                return True
 
-            elif inspect.isclass(retry.retry_on):
+            if inspect.isclass(retry.retry_on):
                 return isinstance(req_or_validation_exc, retry.retry_on)
 
-            else:
-                return retry.retry_on == response_status
+            for maybe_exc in retry_on:
+                if inspect.isclass(maybe_exc) and isinstance(
+                    req_or_validation_exc, maybe_exc
+                ):
+                    return True
 
         return False
 
     @property
     def has_retry(self) -> bool:
-        return self.retry is not None and self.retry != UNSET_VALUE
+        return self._has_retry
 
     @classmethod
     def merge_config(cls, base: GracyConfig, modifier: GracyConfig):
+        if modifier._all_unset:
+            return base  # Nothing to override
+
         new_obj = copy.copy(base)
 
-        for key, value in vars(modifier).items():
-            if getattr(base, key) == UNSET_VALUE:
-                setattr(new_obj, key, value)
-            elif value != UNSET_VALUE:
-                setattr(new_obj, key, value)
+        # Only settings are merged, bypassing __setattr__ so derived values get
+        # recomputed once right after
+        for key in _CONFIG_FIELDS:
+            value = getattr(modifier, key)
+            if value is not UNSET_VALUE or getattr(base, key) is UNSET_VALUE:
+                object.__setattr__(new_obj, key, value)
 
+        new_obj._refresh_derived()
         return new_obj
 
     def get_concurrent_limit(
@@ -636,6 +850,8 @@ class GracyConfig:
         return None
 
 
+_CONFIG_FIELDS: t.Final = tuple(field.name for field in fields(GracyConfig))
+
 DEFAULT_CONFIG: t.Final = GracyConfig(
     log_request=None,
     log_response=None,
@@ -647,15 +863,19 @@ DEFAULT_CONFIG: t.Final = GracyConfig(
 
 
 class BaseEndpoint(str, Enum):
-    def __str__(self) -> str:
-        return self.value
+    # The member is its own value, so str's C implementations skip Enum's dispatch
+    __str__ = str.__str__
+    __format__ = str.__format__
 
 
 Endpoint = t.TypeVar("Endpoint", bound=t.Union[BaseEndpoint, str])  # , default=str)
 
 
 class GracefulRequest:
-    request: httpx.Request
+    __slots__ = ("request", "request_func", "args", "kwargs", "_bound")
+
+    request: httpx.Request | None
+    """Only built when replays are enabled"""
     request_func: t.Callable[..., t.Awaitable[httpx.Response]]
     """Can't use coroutine because we need to retrigger it during retries, and coro can't be awaited twice"""
     args: tuple[t.Any, ...]
@@ -663,7 +883,7 @@ class GracefulRequest:
 
     def __init__(
         self,
-        request: httpx.Request,
+        request: httpx.Request | None,
         request_func: t.Callable[..., t.Awaitable[httpx.Response]],
         *args: t.Any,
         **kwargs: t.Any,
@@ -672,9 +892,11 @@ class GracefulRequest:
         self.request_func = request_func
         self.args = args
         self.kwargs = kwargs
+        # Retries call it again with the same arguments, so bind them only once
+        self._bound = partial(request_func, *args, **kwargs)
 
     def __call__(self) -> t.Awaitable[httpx.Response]:
-        return self.request_func(*self.args, **self.kwargs)
+        return self._bound()
 
 
 class GracyRequestContext:
@@ -3,17 +3,12 @@ from __future__ import annotations
 import httpx
 import re
 import typing as t
-from collections import defaultdict
+from collections import Counter, defaultdict
 from statistics import mean
 
 from .._models import GracyRequestContext, RequestTimeline, ThrottleController
 from ..replays.storages._base import GracyReplay, is_replay
-from ._models import (
-    GracyAggregatedRequest,
-    GracyReport,
-    GracyRequestCounters,
-    GracyRequestResult,
-)
+from ._models import GracyAggregatedRequest, GracyReport, GracyRequestCounters
 
 ANY_REGEX: t.Final = r".+"
 
@@ -24,7 +19,9 @@ REQUEST_SUM_PER_STATUS_TYPE = t.Dict[str, t.DefaultDict[REQUEST_SUM_KEY, int]]
 
 class ReportBuilder:
     def __init__(self) -> None:
-        self._results: t.List[GracyRequestResult] = []
+        # Only what the report needs, so responses aren't kept alive
+        self._status_counts = t.DefaultDict[str, t.Counter[int]](Counter)
+        self._latencies = t.DefaultDict[str, t.List[float]](list)
         self._counters = t.DefaultDict[str, GracyRequestCounters](GracyRequestCounters)
         self._request_history = t.DefaultDict[str, t.List[RequestTimeline]](list)
 
@@ -34,15 +31,19 @@ class ReportBuilder:
         response_or_exc: t.Union[httpx.Response, Exception],
         request_start: float,
     ):
-        self._results.append(
-            GracyRequestResult(request_context.unformatted_url, response_or_exc)
-        )
+        uurl = request_context.unformatted_url
+
         if isinstance(response_or_exc, httpx.Response):
+            self._status_counts[uurl][response_or_exc.status_code] += 1
+            self._latencies[uurl].append(response_or_exc.elapsed.total_seconds())
+
             if is_replay(response_or_exc):
                 self._replayed(request_context)
 
             request_entry = RequestTimeline.build(request_start, response_or_exc)
-            self._request_history[request_context.unformatted_url].append(request_entry)
+            self._request_history[uurl].append(request_entry)
+        else:
+            self._status_counts[uurl][REQUEST_ERROR_STATUS] += 1
 
     def retried(self, request_context: GracyRequestContext):
         self._counters[request_context.unformatted_url].retries += 1
@@ -65,20 +66,13 @@ class ReportBuilder:
         throttle_controller: ThrottleController,
         replay_settings: GracyReplay | None,
     ) -> GracyReport:
-        requests_by_uurl = t.DefaultDict[
-            str, t.Set[t.Union[httpx.Response, Exception]]
-        ](set)
         requests_sum: REQUEST_SUM_PER_STATUS_TYPE = defaultdict(
             lambda: defaultdict(int)
         )
 
-        for result in self._results:
-            requests_by_uurl[result.uurl].add(result.response)
-            requests_sum[result.uurl]["total"] += 1
-            if isinstance(result.response, httpx.Response):
-                requests_sum[result.uurl][result.response.status_code] += 1
-            else:
-                requests_sum[result.uurl][REQUEST_ERROR_STATUS] += 1
+        for uurl, status_counts in self._status_counts.items():
+            requests_sum[uurl]["total"] = sum(status_counts.values())
+            requests_sum[uurl].update(status_counts)
 
         for uurl, counters in self._counters.items():
             requests_sum[uurl]["throttles"] = counters.throttles
@@ -94,12 +88,8 @@ class ReportBuilder:
         report = GracyReport(replay_settings, self._request_history)
 
         for uurl, data in requests_sum.items():
-            all_requests = {
-                req for req in requests_by_uurl[uurl] if isinstance(req, httpx.Response)
-            }
-
             total_requests = data["total"]
-            url_latency = [r.elapsed.total_seconds() for r in all_requests]
+            url_latency = self._latencies.get(uurl, [])
 
             # Rate
             # Use min to handle scenarios like:
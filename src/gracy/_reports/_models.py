@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import httpx
 import typing as t
 from dataclasses import dataclass, field
 from statistics import mean
@@ -9,14 +8,6 @@ from .._models import RequestTimeline
 from ..replays.storages._base import GracyReplay
 
 
-@dataclass(frozen=True)
-class GracyRequestResult:
-    __slots__ = ("uurl", "response")
-
-    uurl: str
-    response: httpx.Response | Exception
-
-
 @dataclass
 class GracyRequestCounters:
     throttles: int = 0
@@ -113,6 +113,10 @@ class BasePrinter(ABC):
 
 class RichPrinter(BasePrinter):
     def print_report(self, report: GracyReport) -> None:
+        if not report.requests:
+            logger.warning("No requests were triggered")
+            return
+
         # Dynamic import so we don't have to require it as dependency
         from rich.console import Console
         from rich.table import Table
@@ -228,6 +232,10 @@ class PlotlyPrinter(BasePrinter):
 
 class ListPrinter(BasePrinter):
     def print_report(self, report: GracyReport) -> None:
+        if not report.requests:
+            logger.warning("No requests were triggered")
+            return
+
         _print_header(report)
 
         entries = report.requests
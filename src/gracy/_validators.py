@@ -8,40 +8,49 @@ from ._models import GracefulValidator
 from .exceptions import NonOkResponse, UnexpectedResponse
 
 
+def _as_frozenset(status_code: t.Union[int, t.Iterable[int]]) -> t.FrozenSet[int]:
+    if isinstance(status_code, int):
+        return frozenset((int(status_code),))
+
+    return frozenset(int(code) for code in status_code)
+
+
 class DefaultValidator(GracefulValidator):
     def check(self, response: httpx.Response) -> None:
-        if response.is_success:
+        if 200 <= response.status_code < 300:
             return None
 
-        raise NonOkResponse(str(response.url), response)
+        raise NonOkResponse(response.url, response)
+
+
+DEFAULT_VALIDATOR: t.Final = DefaultValidator()
 
 
 class StrictStatusValidator(GracefulValidator):
     def __init__(self, status_code: t.Union[int, t.Iterable[int]]) -> None:
-        if isinstance(status_code, t.Iterable):
-            self._status_codes = status_code
-        else:
-            self._status_codes = {status_code}
+        # Kept as given for error messages, while checks go through the frozenset
+        self._expected = (
+            status_code if isinstance(status_code, int) else tuple(status_code)
+        )
+        self._status_codes = _as_frozenset(self._expected)
 
     def check(self, response: httpx.Response) -> None:
         if response.status_code in self._status_codes:
             return None
 
-        raise UnexpectedResponse(str(response.url), response, self._status_codes)
+        raise UnexpectedResponse(response.url, response, self._expected)
 
 
 class AllowedStatusValidator(GracefulValidator):
     def __init__(self, status_code: t.Union[int, t.Iterable[int]]) -> None:
-        if isinstance(status_code, t.Iterable):
-            self._status_codes = status_code
-        else:
-            self._status_codes = {status_code}
+        self._status_codes = _as_frozenset(status_code)
 
     def check(self, response: httpx.Response) -> None:
-        if response.is_success:
+        code = response.status_code
+        if 200 <= code < 300:
             return None
 
-        if response.status_code in self._status_codes:
+        if code in self._status_codes:
             return None
 
-        raise NonOkResponse(str(response.url), response)
+        raise NonOkResponse(response.url, response)
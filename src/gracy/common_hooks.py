@@ -2,29 +2,116 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import math
+import time
 import typing as t
-from asyncio import Lock
-from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
 from http import HTTPStatus
 
 import httpx
 
-from ._loggers import do_log, extract_base_format_args, extract_response_format_args
+from ._loggers import (
+    LogTemplate,
+    add_response_format_args,
+    do_log,
+    extract_base_format_args,
+)
 from ._models import GracyRequestContext, LogEvent
 from ._reports._builders import ReportBuilder
 from .replays.storages._base import is_replay
 
 logger = logging.getLogger("gracy")
 
+_HTTP_429: t.Final = int(HTTPStatus.TOO_MANY_REQUESTS)
 
-@dataclass
-class HookResult:
+
+@lru_cache(maxsize=256)
+def _parse_http_date(value: str) -> datetime | None:
+    """Servers tend to repeat the same Retry-After date during a burst of 429s"""
+    try:
+        # It might be a date as: Wed, 21 Oct 2015 07:28:00 GMT
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        logger.debug("Unable to parse Retry-After %r", value)
+        return None
+
+    if parsed.tzinfo is None:
+        # HTTP-dates are always UTC, e.g. `-0000` yields a naive datetime
+        parsed = parsed.replace(tzinfo=timezone.utc)
+
+    return parsed
+
+
+class HookResult(t.NamedTuple):
     executed: bool
     awaited: float = 0
     dry_run: bool = False
 
 
+class _Cooldowns:
+    """Cooldown deadlines (event loop time) per lock name"""
+
+    __slots__ = ("deadlines", "_waiters")
+
+    def __init__(self) -> None:
+        self.deadlines: t.Dict[str, float] = {}
+        self._waiters: t.Dict[str, asyncio.Future[None]] = {}
+
+    def extend(self, lock_name: str, wait: float) -> float:
+        """
+        Pushes the deadline for `lock_name` so it's at least `wait` seconds from now,
+        and returns how long the caller should sleep.
+
+        There's no `await` in here, so the read-modify-write is atomic.
+        """
+        now = asyncio.get_running_loop().time()
+        deadline = max(self.deadlines.get(lock_name, 0.0), now + wait)
+        self.deadlines[lock_name] = deadline
+
+        return deadline - now
+
+    async def wait(self, lock_name: str) -> HookResult:
+        deadline = self.deadlines.get(lock_name)
+        if deadline is None:
+            return HookResult(False)
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        if deadline <= start:
+            # Drop expired cooldowns so per-endpoint deadlines don't pile up forever
+            del self.deadlines[lock_name]
+            return HookResult(False)
+
+        # Every request waiting on this cooldown shares one future and one timer
+        waiter = self._waiters.get(lock_name)
+        if waiter is None or waiter.get_loop() is not loop:
+            waiter = self._waiters[lock_name] = loop.create_future()
+            loop.call_at(deadline, self._release, lock_name, waiter)
+
+        # Shielded so a cancelled request doesn't cancel everyone else's wait
+        await asyncio.shield(waiter)
+
+        return HookResult(True, loop.time() - start)
+
+    def _release(self, lock_name: str, waiter: asyncio.Future[None]) -> None:
+        if waiter.done():
+            return
+
+        loop = waiter.get_loop()
+        deadline = self.deadlines.get(lock_name, 0.0)
+        if deadline > loop.time():
+            # Extended by another 429, or the timer fired within the clock resolution
+            loop.call_at(deadline, self._release, lock_name, waiter)
+            return
+
+        if self._waiters.get(lock_name) is waiter:
+            del self._waiters[lock_name]
+
+        waiter.set_result(None)
+
+
 class HttpHeaderRetryAfterBackOffHook:
     """
     Provides two methods `before()` and `after()` to be used as hooks by Gracy.
@@ -54,6 +141,7 @@ class HttpHeaderRetryAfterBackOffHook:
     DEFAULT_LOG_MESSAGE: t.Final = (
         "[{METHOD}] {URL} requested to wait for {RETRY_AFTER}s"
     )
+    _LOG_TEMPLATE: t.Final = LogTemplate(DEFAULT_LOG_MESSAGE)
     ALL_CLIENT_LOCK: t.Final = "CLIENT"
 
     def __init__(
@@ -67,7 +155,8 @@ class HttpHeaderRetryAfterBackOffHook:
     ) -> None:
         self._reporter = reporter
         self._lock_per_endpoint = lock_per_endpoint
-        self._lock_manager = t.DefaultDict[str, Lock](Lock)
+        self._client_lock_name = None if lock_per_endpoint else self.ALL_CLIENT_LOCK
+        self._cooldowns = _Cooldowns()
         self._log_event = log_event
         self._processor = seconds_processor or (lambda x: x)
         self._dry_run = dry_run
@@ -79,15 +168,14 @@ class HttpHeaderRetryAfterBackOffHook:
         retry_after: float,
         actual_wait: float,
     ) -> None:
-        if event := self._log_event:
-            format_args: t.Dict[str, str] = dict(
-                **extract_base_format_args(request_context),
-                **extract_response_format_args(response),
-                RETRY_AFTER=str(retry_after),
-                RETRY_AFTER_ACTUAL_WAIT=str(actual_wait),
-            )
+        event = self._log_event
+        if event and logger.isEnabledFor(event.level):
+            format_args = extract_base_format_args(request_context)
+            add_response_format_args(format_args, response)
+            format_args["RETRY_AFTER"] = str(retry_after)
+            format_args["RETRY_AFTER_ACTUAL_WAIT"] = str(actual_wait)
 
-            do_log(event, self.DEFAULT_LOG_MESSAGE, format_args, response)
+            do_log(event, self._LOG_TEMPLATE, format_args, response)
 
     def _parse_retry_after_as_seconds(self, response: httpx.Response) -> float:
         retry_after_value = response.headers.get("retry-after")
@@ -95,60 +183,62 @@ class HttpHeaderRetryAfterBackOffHook:
         if retry_after_value is None:
             return 0
 
-        if retry_after_value.isdigit():
-            return int(retry_after_value)
-
         try:
-            # It might be a date as: Wed, 21 Oct 2015 07:28:00 GMT
-            date_time = datetime.strptime(retry_after_value, "%a, %d %b %Y %H:%M:%S %Z")
-            date_as_seconds = (date_time - datetime.now()).total_seconds()
-
-        except Exception:
-            logger.exception(
-                f"Unable to parse {retry_after_value} as date within {type(self).__name__}"
-            )
+            # Most servers send delay-seconds, sometimes with decimals (e.g. 1.5)
+            seconds = float(retry_after_value)
+        except ValueError:
+            pass
+        else:
+            # float() also takes "inf" and "nan", which would stall requests forever
+            if math.isfinite(seconds) and seconds >= 0:
+                return seconds
+
             return 0
 
-        else:
-            return date_as_seconds
+        date_time = _parse_http_date(retry_after_value)
+        if date_time is None:
+            return 0
+
+        # The HTTP-date is absolute, so it needs the wall clock. Cooldowns themselves
+        # are tracked with the event loop's monotonic clock.
+        return max(0.0, date_time.timestamp() - time.time())
+
+    def _get_lock_name(self, context: GracyRequestContext) -> str:
+        return self._client_lock_name or context.unformatted_url
 
     async def before(self, context: GracyRequestContext) -> HookResult:
-        return HookResult(False)
+        return await self._cooldowns.wait(self._get_lock_name(context))
 
     async def after(
         self,
         context: GracyRequestContext,
         response_or_exc: httpx.Response | Exception,
     ) -> HookResult:
-        if (
-            isinstance(response_or_exc, httpx.Response)
-            and response_or_exc.status_code == HTTPStatus.TOO_MANY_REQUESTS
-        ):
-            if is_replay(response_or_exc):
-                return HookResult(executed=False, dry_run=self._dry_run)
-
-            retry_after_seconds = self._parse_retry_after_as_seconds(response_or_exc)
-            actual_wait = self._processor(retry_after_seconds)
-
-            if retry_after_seconds > 0:
-                lock_name = (
-                    context.unformatted_url
-                    if self._lock_per_endpoint
-                    else self.ALL_CLIENT_LOCK
-                )
+        # Exceptions have no status code, so this also filters them out
+        if getattr(response_or_exc, "status_code", None) != _HTTP_429:
+            return HookResult(False, dry_run=self._dry_run)
+
+        response = t.cast(httpx.Response, response_or_exc)
+        if is_replay(response):
+            return HookResult(executed=False, dry_run=self._dry_run)
 
-                async with self._lock_manager[lock_name]:
-                    self._process_log(
-                        context, response_or_exc, retry_after_seconds, actual_wait
-                    )
+        retry_after_seconds = self._parse_retry_after_as_seconds(response)
+        actual_wait = self._processor(retry_after_seconds)
 
-                    if self._reporter:
-                        self._reporter.throttled(context)
+        if retry_after_seconds > 0:
+            if self._log_event is not None:
+                self._process_log(context, response, retry_after_seconds, actual_wait)
 
-                    if self._dry_run is False:
-                        await asyncio.sleep(actual_wait)
+            if self._reporter:
+                self._reporter.throttled(context)
 
-                    return HookResult(True, actual_wait, self._dry_run)
+            if self._dry_run is False:
+                actual_wait = self._cooldowns.extend(
+                    self._get_lock_name(context), actual_wait
+                )
+                await asyncio.sleep(actual_wait)
+
+            return HookResult(True, actual_wait, self._dry_run)
 
         return HookResult(False, dry_run=self._dry_run)
 
@@ -177,6 +267,7 @@ class RateLimitBackOffHook:
     DEFAULT_LOG_MESSAGE: t.Final = (
         "[{METHOD}] {UENDPOINT} got rate limited, waiting for {WAIT_TIME}s"
     )
+    _LOG_TEMPLATE: t.Final = LogTemplate(DEFAULT_LOG_MESSAGE)
     ALL_CLIENT_LOCK: t.Final = "CLIENT"
 
     def __init__(
@@ -190,53 +281,56 @@ class RateLimitBackOffHook:
     ) -> None:
         self._reporter = reporter
         self._lock_per_endpoint = lock_per_endpoint
-        self._lock_manager = t.DefaultDict[str, Lock](Lock)
+        self._client_lock_name = None if lock_per_endpoint else self.ALL_CLIENT_LOCK
+        self._cooldowns = _Cooldowns()
         self._log_event = log_event
         self._delay = delay
         self._dry_run = dry_run
+        # Nothing to log, report, or wait for, so after() only has to flag the 429
+        self._fastpath_dry_run = dry_run and log_event is None and reporter is None
 
     def _process_log(
         self, request_context: GracyRequestContext, response: httpx.Response
     ) -> None:
-        if event := self._log_event:
-            format_args: t.Dict[str, str] = dict(
-                **extract_base_format_args(request_context),
-                **extract_response_format_args(response),
-                WAIT_TIME=str(self._delay),
-            )
+        event = self._log_event
+        if event and logger.isEnabledFor(event.level):
+            format_args = extract_base_format_args(request_context)
+            add_response_format_args(format_args, response)
+            format_args["WAIT_TIME"] = str(self._delay)
 
-            do_log(event, self.DEFAULT_LOG_MESSAGE, format_args, response)
+            do_log(event, self._LOG_TEMPLATE, format_args, response)
+
+    def _get_lock_name(self, context: GracyRequestContext) -> str:
+        return self._client_lock_name or context.unformatted_url
 
     async def before(self, context: GracyRequestContext) -> HookResult:
-        return HookResult(False)
+        return await self._cooldowns.wait(self._get_lock_name(context))
 
     async def after(
         self,
         context: GracyRequestContext,
         response_or_exc: httpx.Response | Exception,
     ) -> HookResult:
-        if (
-            isinstance(response_or_exc, httpx.Response)
-            and response_or_exc.status_code == HTTPStatus.TOO_MANY_REQUESTS
-        ):
-            if is_replay(response_or_exc):
-                return HookResult(executed=False, dry_run=self._dry_run)
+        # Exceptions have no status code, so this also filters them out
+        if getattr(response_or_exc, "status_code", None) != _HTTP_429:
+            return HookResult(False, dry_run=self._dry_run)
 
-            lock_name = (
-                context.unformatted_url
-                if self._lock_per_endpoint
-                else self.ALL_CLIENT_LOCK
-            )
+        response = t.cast(httpx.Response, response_or_exc)
+        if is_replay(response):
+            return HookResult(executed=False, dry_run=self._dry_run)
 
-            async with self._lock_manager[lock_name]:
-                self._process_log(context, response_or_exc)
+        if self._fastpath_dry_run:
+            return HookResult(True, self._delay, True)
 
-                if self._reporter:
-                    self._reporter.throttled(context)
+        if self._log_event is not None:
+            self._process_log(context, response)
 
-                if self._dry_run is False:
-                    await asyncio.sleep(self._delay)
+        if self._reporter:
+            self._reporter.throttled(context)
 
-                return HookResult(True, self._delay, self._dry_run)
+        awaited = self._delay
+        if self._dry_run is False:
+            awaited = self._cooldowns.extend(self._get_lock_name(context), self._delay)
+            await asyncio.sleep(awaited)
 
-        return HookResult(False, dry_run=self._dry_run)
+        return HookResult(True, awaited, self._dry_run)
@@ -20,6 +20,16 @@ class GracyException(Exception, ABC):
         """
         pass
 
+    @property
+    def args(self) -> tuple[t.Any, ...]:
+        # Messages built on demand aren't passed to `__init__`, so they show up here
+        args = BaseException.args.__get__(self)
+        return args if args else (str(self),)
+
+    @args.setter
+    def args(self, value: t.Iterable[t.Any]) -> None:
+        BaseException.args.__set__(self, value)
+
 
 class GracyRequestFailed(GracyException):
     """
@@ -67,15 +77,25 @@ class GracyRequestFailed(GracyException):
 
 class GracyParseFailed(GracyException):
     def __init__(self, response: httpx.Response) -> None:
-        msg = (
-            f"Unable to parse result from [{response.request.method}] {response.url} ({response.status_code}). "
-            f"Response content is: {response.text}"
-        )
-
         self.url = response.request.url
         self.response = response
 
-        super().__init__(msg)
+        # Decoding the whole body only pays off if the message is ever shown
+        self._message: str | None = None
+        super().__init__()
+
+    def __str__(self) -> str:
+        if self._message is None:
+            response = self.response
+            self._message = (
+                f"Unable to parse result from [{response.request.method}] {response.url} ({response.status_code}). "
+                f"Response content is: {response.text}"
+            )
+
+        return self._message
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({str(self)!r})"
 
     def __reduce__(self) -> REDUCE_PICKABLE_RETURN:
         return (GracyParseFailed, (self.response,))
@@ -85,11 +105,11 @@ class BadResponse(GracyException):
     def __init__(
         self,
         message: str | None,
-        url: str,
+        url: str | httpx.URL,
         response: httpx.Response,
         expected: str | int | t.Iterable[int],
     ) -> None:
-        self.url = url
+        self._url = url
         self.response = response
 
         self._args = (
@@ -99,6 +119,29 @@ class BadResponse(GracyException):
             expected,
         )
 
+        # Built on demand, since these are often caught (e.g. retries) and never shown
+        self._message = message
+        super().__init__()
+
+    @property
+    def url(self) -> str:
+        if not isinstance(self._url, str):
+            self._url = str(self._url)
+
+        return self._url
+
+    def __str__(self) -> str:
+        if self._message is None:
+            self._message = self._build_message()
+
+        return self._message
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({str(self)!r})"
+
+    def _build_message(self) -> str:
+        _, _, response, expected = self._args
+
         if isinstance(expected, str):
             expectedstr = expected
         elif isinstance(expected, int):
@@ -106,33 +149,32 @@ class BadResponse(GracyException):
         else:
             expectedstr = ", ".join([str(s) for s in expected])
 
-        curmsg = (
-            message
-            or f"{url} raised {response.status_code}, but it was expecting {expectedstr}"
+        return (
+            f"{self.url} raised {response.status_code}, "
+            f"but it was expecting {expectedstr}"
         )
 
-        super().__init__(curmsg)
-
     def __reduce__(self) -> REDUCE_PICKABLE_RETURN:
         return (BadResponse, self._args)
 
 
 class UnexpectedResponse(BadResponse):
     def __init__(
-        self, url: str, response: httpx.Response, expected: str | int | t.Iterable[int]
+        self,
+        url: str | httpx.URL,
+        response: httpx.Response,
+        expected: str | int | t.Iterable[int],
     ) -> None:
         super().__init__(None, url, response, expected)
 
-        self.url = url
-        self.response = response
         self.expected = expected
 
     def __reduce__(self) -> REDUCE_PICKABLE_RETURN:
-        return (UnexpectedResponse, (self.url, self.response, self.expected))
+        return (UnexpectedResponse, (self._url, self.response, self.expected))
 
 
 class NonOkResponse(BadResponse):
-    def __init__(self, url: str, response: httpx.Response) -> None:
+    def __init__(self, url: str | httpx.URL, response: httpx.Response) -> None:
         super().__init__(None, url, response, "any successful status code")
 
         self.arg1 = url
@@ -142,6 +184,36 @@ class NonOkResponse(BadResponse):
         return (NonOkResponse, (self.arg1, self.arg2))
 
 
+USER_DEFINED_ARGS: t.Final[
+    dict[str, t.Callable[[GracyRequestContext, httpx.Response], t.Any]]
+] = {
+    # Context
+    "ENDPOINT": lambda context, _: context.endpoint,
+    "UURL": lambda context, _: context.unformatted_url,
+    "UENDPOINT": lambda context, _: context.unformatted_endpoint,
+    # Response
+    "URL": lambda _, response: response.request.url,
+    "METHOD": lambda _, response: response.request.method,
+    "STATUS": lambda _, response: response.status_code,
+    "ELAPSED": lambda _, response: response.elapsed,
+}
+
+
+class _UserDefinedArgs:
+    """Mapping for `str.format_map` that only computes the placeholders a message uses"""
+
+    __slots__ = ("_request_context", "_response")
+
+    def __init__(
+        self, request_context: GracyRequestContext, response: httpx.Response
+    ) -> None:
+        self._request_context = request_context
+        self._response = response
+
+    def __getitem__(self, key: str) -> t.Any:
+        return USER_DEFINED_ARGS[key](self._request_context, self._response)
+
+
 class GracyUserDefinedException(GracyException):
     BASE_MESSAGE: str = "[{METHOD}] {URL} returned {}"
 
@@ -154,24 +226,17 @@ class GracyUserDefinedException(GracyException):
 
     def _build_default_args(self) -> dict[str, t.Any]:
         request_context = self._request_context
+        response = self._response
 
-        return dict(
-            # Context
-            ENDPOINT=request_context.endpoint,
-            UURL=request_context.unformatted_url,
-            UENDPOINT=request_context.unformatted_endpoint,
-            # Response
-            URL=self.response.request.url,
-            METHOD=self.response.request.method,
-            STATUS=self.response.status_code,
-            ELAPSED=self.response.elapsed,
-        )
+        return {
+            name: get_arg(request_context, response)
+            for name, get_arg in USER_DEFINED_ARGS.items()
+        }
 
     def _format_message(
         self, request_context: GracyRequestContext, response: httpx.Response
     ) -> str:
-        format_args = self._build_default_args()
-        return self.BASE_MESSAGE.format(**format_args)
+        return self.BASE_MESSAGE.format_map(_UserDefinedArgs(request_context, response))
 
     @property
     def url(self):
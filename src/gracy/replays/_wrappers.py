@@ -5,7 +5,7 @@ from functools import wraps
 
 import httpx
 
-from gracy._general import extract_request_kwargs
+from gracy._general import VALID_BUILD_REQUEST_KEYS
 from gracy.exceptions import GracyReplayRequestNotFound
 
 from .storages._base import GracyReplay
@@ -14,11 +14,14 @@ httpx_func_type = t.Callable[..., t.Awaitable[httpx.Response]]
 
 
 def record_mode(replay: GracyReplay, httpx_request_func: httpx_func_type):
+    record = replay.storage.record
+    inc_record = replay.inc_record
+
     @wraps(httpx_request_func)
     async def _wrapper(*args: t.Any, **kwargs: t.Any):
         httpx_response = await httpx_request_func(*args, **kwargs)
-        await replay.storage.record(httpx_response)
-        replay.inc_record()
+        await record(httpx_response)
+        inc_record()
 
         return httpx_response
 
@@ -28,17 +31,23 @@ def record_mode(replay: GracyReplay, httpx_request_func: httpx_func_type):
 def replay_mode(
     replay: GracyReplay, client: httpx.AsyncClient, httpx_request_func: httpx_func_type
 ):
+    load = replay.storage.load
+    inc_replay = replay.inc_replay
+    build_request = client.build_request
+
     @wraps(httpx_request_func)
     async def _wrapper(*args: t.Any, **kwargs: t.Any):
-        request_kwargs = extract_request_kwargs(kwargs)
-        request = client.build_request(*args, **request_kwargs)
+        request_kwargs = {
+            k: v for k, v in kwargs.items() if k in VALID_BUILD_REQUEST_KEYS
+        }
+        request = build_request(*args, **request_kwargs)
 
-        stored_response = await replay.storage.load(
+        stored_response = await load(
             request,
             replay.discard_replays_older_than,
             replay.discard_bad_responses,
         )
-        replay.inc_replay()
+        inc_replay()
 
         return stored_response
 
@@ -48,13 +57,21 @@ def replay_mode(
 def smart_replay_mode(
     replay: GracyReplay, client: httpx.AsyncClient, httpx_request_func: httpx_func_type
 ):
+    load = replay.storage.load
+    record = replay.storage.record
+    inc_replay = replay.inc_replay
+    inc_record = replay.inc_record
+    build_request = client.build_request
+
     @wraps(httpx_request_func)
     async def _wrapper(*args: t.Any, **kwargs: t.Any):
-        request_kwargs = extract_request_kwargs(kwargs)
-        request = client.build_request(*args, **request_kwargs)
+        request_kwargs = {
+            k: v for k, v in kwargs.items() if k in VALID_BUILD_REQUEST_KEYS
+        }
+        request = build_request(*args, **request_kwargs)
 
         try:
-            stored_response = await replay.storage.load(
+            stored_response = await load(
                 request,
                 replay.discard_replays_older_than,
                 replay.discard_bad_responses,
@@ -62,13 +79,13 @@ def smart_replay_mode(
 
         except GracyReplayRequestNotFound:
             httpx_response = await httpx_request_func(*args, **kwargs)
-            await replay.storage.record(httpx_response)
+            await record(httpx_response)
             response = httpx_response
-            replay.inc_record()
+            inc_record()
 
         else:
             response = stored_response
-            replay.inc_replay()
+            inc_replay()
 
         return response
 
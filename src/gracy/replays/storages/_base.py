@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import logging
+import pickle
 import typing as t
+import zlib
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime
 
@@ -10,7 +13,7 @@ import httpx
 
 from gracy.exceptions import GracyReplayRequestNotFound
 
-from ..._loggers import DefaultLogMessage, do_log
+from ..._loggers import MSG_REPLAY_RECORDED, MSG_REPLAY_REPLAYED, do_log
 from ..._models import LogEvent
 
 logger = logging.getLogger(__name__)
@@ -18,11 +21,71 @@ logger = logging.getLogger(__name__)
 
 REPLAY_FLAG: t.Final = "_gracy_replayed"
 
+PICKLE_PROTOCOL: t.Final = 5
+"""Pinned so recordings stay readable across every supported Python version"""
+
+ZLIB_HEADER: t.Final = b"\x78"
+"""Compressed recordings start with it, while pickles always start with `\\x80`"""
+
+
+def dump_response(response: httpx.Response, compress_level: int | None) -> bytes:
+    serialized = pickle.dumps(response, protocol=PICKLE_PROTOCOL)
+    if compress_level is None:
+        return serialized
+
+    return zlib.compress(serialized, compress_level)
+
+
+def load_response(serialized: bytes) -> httpx.Response:
+    if serialized[:1] == ZLIB_HEADER:
+        serialized = zlib.decompress(serialized)
+
+    return pickle.loads(serialized)
+
 
 def is_replay(resp: httpx.Response) -> bool:
     return getattr(resp, REPLAY_FLAG, False)
 
 
+REPLAY_CACHE_KEY = t.Tuple[str, str, t.Optional[bytes]]
+
+
+def get_replay_cache_key(request: httpx.Request) -> REPLAY_CACHE_KEY:
+    return (str(request.url), request.method, request.content or None)
+
+
+class ReplayLookupCache:
+    """
+    Keeps the most recently found stored replays in memory, so requests that are
+    replayed over and over again skip the storage round trip.
+
+    Only hits are kept, and storages must `discard` a key once they record it again.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[REPLAY_CACHE_KEY, t.Any] = OrderedDict()
+
+    def get(self, key: REPLAY_CACHE_KEY) -> t.Any | None:
+        found = self._entries.get(key)
+        if found is not None:
+            self._entries.move_to_end(key)
+
+        return found
+
+    def store(self, key: REPLAY_CACHE_KEY, found: t.Any) -> None:
+        if self._max_entries <= 0:
+            return
+
+        self._entries[key] = found
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def discard(self, key: REPLAY_CACHE_KEY) -> None:
+        self._entries.pop(key, None)
+
+
 class GracyReplayStorage(ABC):
     def prepare(self) -> None:
         """(Optional) Executed upon API instance creation."""
@@ -117,7 +180,7 @@ class GracyReplay:
         if log_ev := self.log_record:
             if self.records_made % log_ev.frequency == 0:
                 args = dict(RECORDED_COUNT=f"{self.records_made:,}")
-                do_log(log_ev, DefaultLogMessage.REPLAY_RECORDED, args)
+                do_log(log_ev, MSG_REPLAY_RECORDED, args)
 
     def inc_replay(self):
         self.replays_made += 1
@@ -125,4 +188,4 @@ class GracyReplay:
         if log_ev := self.log_replay:
             if self.replays_made % log_ev.frequency == 0:
                 args = dict(REPLAYED_COUNT=f"{self.replays_made:,}")
-                do_log(log_ev, DefaultLogMessage.REPLAY_REPLAYED, args)
+                do_log(log_ev, MSG_REPLAY_REPLAYED, args)
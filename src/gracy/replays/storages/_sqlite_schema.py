@@ -8,11 +8,12 @@ CREATE_RECORDINGS_TABLE: t.Final = f"""
 CREATE TABLE {TABLE_NAME}(
     url VARCHAR(255) NOT NULL,
     method VARCHAR(20) NOT NULL,
+    updated_at DATETIME NOT NULL,
     request_body BLOB NULL,
-    response BLOB NOT NULL,
-    updated_at DATETIME NOT NULL
+    response BLOB NOT NULL
 )
 """
+"""Blobs go last, so reading `updated_at` doesn't walk through their overflow pages"""
 
 INDEX_RECORDINGS_TABLE: t.Final = f"""
 CREATE UNIQUE INDEX idx_gracy_request
@@ -26,12 +27,12 @@ WHERE request_body IS NULL
 """
 
 INSERT_RECORDING_BASE: t.Final = f"""
-INSERT OR REPLACE INTO {TABLE_NAME}
+INSERT OR REPLACE INTO {TABLE_NAME}(url, method, request_body, response, updated_at)
 VALUES (?, ?, ?, ?, ?)
 """
 
 FIND_REQUEST_WITH_REQ_BODY: t.Final = f"""
-SELECT response, updated_at FROM {TABLE_NAME}
+SELECT rowid, updated_at FROM {TABLE_NAME}
 WHERE
 url = ? AND
 method = ? AND
@@ -39,9 +40,14 @@ request_body = ?
 """
 
 FIND_REQUEST_WITHOUT_REQ_BODY: t.Final = f"""
-SELECT response, updated_at FROM {TABLE_NAME}
+SELECT rowid, updated_at FROM {TABLE_NAME}
 WHERE
 url = ? AND
 method = ? AND
 request_body IS NULL
 """
+
+FIND_RESPONSE: t.Final = f"""
+SELECT response FROM {TABLE_NAME}
+WHERE rowid = ?
+"""
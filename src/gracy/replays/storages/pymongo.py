@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import httpx
 import json
-import pickle
 import typing as t
 from dataclasses import asdict, dataclass
 from datetime import datetime
@@ -10,7 +9,13 @@ from threading import Lock
 
 from gracy.exceptions import GracyReplayRequestNotFound
 
-from ._base import GracyReplayStorage
+from ._base import (
+    GracyReplayStorage,
+    ReplayLookupCache,
+    dump_response,
+    get_replay_cache_key,
+    load_response,
+)
 
 try:
     import pymongo
@@ -57,6 +62,8 @@ def get_unique_keys_from_request(
     }
 
 
+_REPLAY_PROJECTION: t.Final = {"_id": 0, "response": 1, "updated_at": 1}
+
 batch_lock = Lock()
 
 
@@ -67,6 +74,8 @@ class MongoReplayStorage(GracyReplayStorage):
         database_name: str = "gracy",
         collection_name: str = "gracy-replay",
         batch_size: int | None = None,
+        cache_size: int = 0,
+        compress_level: int | None = None,
     ) -> None:
         creds_kwargs = asdict(creds)
 
@@ -75,6 +84,8 @@ class MongoReplayStorage(GracyReplayStorage):
         self._collection = mongo_db[collection_name]
         self._batch = batch_size
         self._batch_ops: t.List[pymongo.ReplaceOne[MongoReplayDocument]] = []
+        self._found = ReplayLookupCache(cache_size)
+        self._compress_level = compress_level
 
     def _flush_batch(self) -> None:
         if self._batch_ops:
@@ -102,7 +113,7 @@ class MongoReplayStorage(GracyReplayStorage):
         )
 
     async def record(self, response: httpx.Response) -> None:
-        response_serialized = pickle.dumps(response)
+        response_serialized = dump_response(response, self._compress_level)
 
         response_content = response.text or None
         content_type = response.headers.get("Content-Type")
@@ -126,15 +137,22 @@ class MongoReplayStorage(GracyReplayStorage):
         )
 
         self._create_or_batch(doc)
+        self._found.discard(get_replay_cache_key(response.request))
 
     async def find_replay(
         self, request: httpx.Request, discard_before: datetime | None
     ) -> MongoReplayDocument | None:
-        filter = get_unique_keys_from_request(request)
-        doc = self._collection.find_one(filter)
-
+        key = get_replay_cache_key(request)
+        doc = self._found.get(key)
         if doc is None:
-            return None
+            filter = get_unique_keys_from_request(request)
+            # Only what replaying needs, so the cache never holds `response_content`
+            doc = self._collection.find_one(filter, _REPLAY_PROJECTION)
+
+            if doc is None:
+                return None
+
+            self._found.store(key, doc)
 
         if discard_before and doc["updated_at"] < discard_before:
             return None
@@ -150,7 +168,7 @@ class MongoReplayStorage(GracyReplayStorage):
             raise GracyReplayRequestNotFound(request)
 
         serialized_response = doc["response"]
-        response: httpx.Response = pickle.loads(serialized_response)
+        response: httpx.Response = load_response(serialized_response)
 
         return response
 
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import httpx
 import logging
-import pickle
 import sqlite3
 import typing as t
 from dataclasses import dataclass
@@ -12,7 +11,13 @@ from pathlib import Path
 from gracy.exceptions import GracyReplayRequestNotFound
 
 from . import _sqlite_schema as schema
-from ._base import GracyReplayStorage
+from ._base import (
+    GracyReplayStorage,
+    ReplayLookupCache,
+    dump_response,
+    get_replay_cache_key,
+    load_response,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -30,11 +35,20 @@ class GracyRecording:
 
 class SQLiteReplayStorage(GracyReplayStorage):
     def __init__(
-        self, db_name: str = "gracy-records.sqlite3", dir: str = ".gracy"
+        self,
+        db_name: str = "gracy-records.sqlite3",
+        dir: str = ".gracy",
+        cache_size: int = 1024,
+        compress_level: int | None = None,
+        batch_size: int | None = None,
     ) -> None:
         self.db_dir = Path(dir)
         self.db_file = self.db_dir / db_name
         self._con: sqlite3.Connection = None  # type: ignore
+        self._found = ReplayLookupCache(cache_size)
+        self._compress_level = compress_level
+        self._batch = batch_size
+        self._batch_rows: t.List[t.Tuple[t.Any, ...]] = []
 
     def _create_db(self) -> None:
         logger.info("Creating Gracy Replay sqlite database")
@@ -45,9 +59,13 @@ class SQLiteReplayStorage(GracyReplayStorage):
         cur.execute(schema.INDEX_RECORDINGS_TABLE)
         cur.execute(schema.INDEX_RECORDINGS_TABLE_WITHOUT_REQUEST_BODY)
 
-    def _insert_into_db(self, recording: GracyRecording) -> None:
-        cur = self._con.cursor()
+    def _flush_batch(self) -> None:
+        if self._batch_rows:
+            self._con.executemany(schema.INSERT_RECORDING_BASE, self._batch_rows)
+            self._con.commit()
+            self._batch_rows = []
 
+    def _insert_into_db(self, recording: GracyRecording) -> None:
         params = (
             recording.url,
             recording.method,
@@ -55,8 +73,17 @@ class SQLiteReplayStorage(GracyReplayStorage):
             recording.response,
             datetime.now(),
         )
-        cur.execute(schema.INSERT_RECORDING_BASE, params)
-        self._con.commit()
+
+        if self._batch and self._batch > 1:
+            # Committing once per batch rather than once per recorded response
+            self._batch_rows.append(params)
+            if len(self._batch_rows) >= self._batch:
+                self._flush_batch()
+
+        else:
+            cur = self._con.cursor()
+            cur.execute(schema.INSERT_RECORDING_BASE, params)
+            self._con.commit()
 
     def prepare(self) -> None:
         self.db_dir.mkdir(parents=True, exist_ok=True)
@@ -66,7 +93,7 @@ class SQLiteReplayStorage(GracyReplayStorage):
         self._con = sqlite3.connect(str(self.db_file))
 
     async def record(self, response: httpx.Response) -> None:
-        response_serialized = pickle.dumps(response)
+        response_serialized = dump_response(response, self._compress_level)
 
         recording = GracyRecording(
             str(response.url),
@@ -77,8 +104,18 @@ class SQLiteReplayStorage(GracyReplayStorage):
         )
 
         self._insert_into_db(recording)
+        self._found.discard(get_replay_cache_key(response.request))
+
+    def _find_record(
+        self, request: httpx.Request, discard_before: datetime | None = None
+    ):
+        key = get_replay_cache_key(request)
+        if (cached := self._found.get(key)) is not None:
+            return cached
+
+        # Otherwise smart replays would miss what was just recorded
+        self._flush_batch()
 
-    def _find_record(self, request: httpx.Request):
         cur = self._con.cursor()
         params: t.Iterable[str | bytes]
 
@@ -89,13 +126,29 @@ class SQLiteReplayStorage(GracyReplayStorage):
             params = (str(request.url), request.method)
             cur.execute(schema.FIND_REQUEST_WITHOUT_REQ_BODY, params)
 
-        fetch_res = cur.fetchone()
+        # The response blob is only read once we know the replay is going to be used
+        found = cur.fetchone()
+        if found is None:
+            return None
+
+        rowid, updated_at = found
+        if isinstance(updated_at, str):
+            # sqlite3 stores datetimes as ISO strings and hands them back as is
+            updated_at = datetime.fromisoformat(updated_at)
+
+        if discard_before and updated_at < discard_before:
+            return None
+
+        cur.execute(schema.FIND_RESPONSE, (rowid,))
+        fetch_res = (cur.fetchone()[0], updated_at)
+        self._found.store(key, fetch_res)
+
         return fetch_res
 
     async def find_replay(
         self, request: httpx.Request, discard_before: datetime | None
     ) -> t.Any | None:
-        fetch_res = self._find_record(request)
+        fetch_res = self._find_record(request, discard_before)
         if fetch_res is None:
             return None
 
@@ -114,6 +167,9 @@ class SQLiteReplayStorage(GracyReplayStorage):
             raise GracyReplayRequestNotFound(request)
 
         serialized_response: bytes = fetch_res[0]
-        response: httpx.Response = pickle.loads(serialized_response)
+        response: httpx.Response = load_response(serialized_response)
 
         return response
+
+    def flush(self) -> None:
+        self._flush_batch()
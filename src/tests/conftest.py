@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import typing as t
+from datetime import datetime
 
 import httpx
 
@@ -27,7 +28,9 @@ class FakeReplayStorage(SQLiteReplayStorage):
         self._response_idx = 0
         super().__init__("pokeapi.sqlite3")
 
-    def _find_record(self, request: httpx.Request):
+    def _find_record(
+        self, request: httpx.Request, discard_before: datetime | None = None
+    ):
         cur = self._con.cursor()
         url = self._force_urls[self._response_idx]
         self._response_idx += 1
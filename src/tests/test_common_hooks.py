@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import asyncio
+import httpx
+import pytest
+import typing as t
+from datetime import timezone
+from http import HTTPStatus
+
+from gracy import GracyConfig, GracyRequestContext
+from gracy.common_hooks import (
+    HttpHeaderRetryAfterBackOffHook,
+    RateLimitBackOffHook,
+    _parse_http_date,
+)
+
+DELAY: t.Final = 0.2
+TOLERANCE: t.Final = 0.1
+
+
+def make_context(endpoint: str) -> GracyRequestContext:
+    return GracyRequestContext(
+        "GET", "https://pokeapi.co/api/v2", endpoint, None, GracyConfig()
+    )
+
+
+def make_response(
+    context: GracyRequestContext, status: int = HTTPStatus.TOO_MANY_REQUESTS
+) -> httpx.Response:
+    return httpx.Response(status, request=httpx.Request("GET", context.url))
+
+
+async def test_before_waits_for_ongoing_cooldown():
+    hook = RateLimitBackOffHook(DELAY)
+    context = make_context("/pokemon/charmander")
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+
+    after_task = asyncio.create_task(hook.after(context, make_response(context)))
+    await asyncio.sleep(0)
+    before_result = await hook.before(context)
+    await after_task
+
+    assert before_result.executed is True
+    assert before_result.awaited > 0
+    assert loop.time() - start >= DELAY - TOLERANCE
+
+
+async def test_before_doesnt_wait_without_cooldown():
+    hook = RateLimitBackOffHook(DELAY)
+    context = make_context("/pokemon/charmander")
+
+    await hook.after(context, make_response(context, HTTPStatus.OK))
+    result = await hook.before(context)
+
+    assert result.executed is False
+    assert result.awaited == 0
+
+
+async def test_lock_per_endpoint_doesnt_block_other_endpoints():
+    hook = RateLimitBackOffHook(DELAY, lock_per_endpoint=True)
+    limited_context = make_context("/pokemon/{NAME}")
+    other_context = make_context("/berry/{NAME}")
+
+    after_task = asyncio.create_task(
+        hook.after(limited_context, make_response(limited_context))
+    )
+    await asyncio.sleep(0)
+    other_result = await hook.before(other_context)
+    limited_result = await hook.before(limited_context)
+    await after_task
+
+    assert other_result.executed is False
+    assert limited_result.executed is True
+
+
+async def test_dry_run_never_blocks():
+    hook = RateLimitBackOffHook(DELAY, dry_run=True)
+    context = make_context("/pokemon/charmander")
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+
+    after_result = await hook.after(context, make_response(context))
+    before_result = await hook.before(context)
+
+    assert after_result.executed is True
+    assert after_result.dry_run is True
+    assert before_result.executed is False
+    assert loop.time() - start < TOLERANCE
+
+
+async def test_concurrent_rate_limits_stall_only_once():
+    CONCURRENT_REQUESTS: t.Final = 5
+    hook = RateLimitBackOffHook(DELAY)
+    context = make_context("/pokemon/charmander")
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+
+    results = await asyncio.gather(
+        *[
+            hook.after(context, make_response(context))
+            for _ in range(CONCURRENT_REQUESTS)
+        ]
+    )
+
+    assert all(result.executed for result in results)
+    assert loop.time() - start < DELAY * 2
+
+
+def test_retry_after_accepts_http_date():
+    hook = HttpHeaderRetryAfterBackOffHook()
+    context = make_context("/pokemon/charmander")
+    in_the_past = "Wed, 21 Oct 2015 07:28:00 GMT"
+    response = httpx.Response(
+        HTTPStatus.TOO_MANY_REQUESTS,
+        headers={"retry-after": in_the_past},
+        request=httpx.Request("GET", context.url),
+    )
+
+    assert hook._parse_retry_after_as_seconds(response) == 0
+
+
+def test_retry_after_http_date_without_timezone_is_utc():
+    parsed = _parse_http_date("Wed, 21 Oct 2015 07:28:00 -0000")
+
+    assert parsed is not None
+    assert parsed.tzinfo is timezone.utc
+
+
+def test_retry_after_accepts_decimal_seconds():
+    hook = HttpHeaderRetryAfterBackOffHook()
+    context = make_context("/pokemon/charmander")
+    response = httpx.Response(
+        HTTPStatus.TOO_MANY_REQUESTS,
+        headers={"retry-after": "1.5"},
+        request=httpx.Request("GET", context.url),
+    )
+
+    assert hook._parse_retry_after_as_seconds(response) == 1.5
+
+
+async def test_expired_cooldowns_are_dropped():
+    hook = RateLimitBackOffHook(0, lock_per_endpoint=True)
+    context = make_context("/pokemon/{NAME}")
+
+    await hook.after(context, make_response(context))
+    await hook.before(context)
+
+    assert hook._cooldowns.deadlines == {}
+
+
+async def test_cancelled_waiter_doesnt_cancel_others():
+    hook = RateLimitBackOffHook(DELAY)
+    context = make_context("/pokemon/charmander")
+
+    after_task = asyncio.create_task(hook.after(context, make_response(context)))
+    await asyncio.sleep(0)
+    cancelled_waiter = asyncio.create_task(hook.before(context))
+    waiter = asyncio.create_task(hook.before(context))
+    await asyncio.sleep(0)
+
+    cancelled_waiter.cancel()
+    result = await waiter
+    await after_task
+
+    assert cancelled_waiter.cancelled()
+    assert result.executed is True
+    assert result.awaited >= DELAY - TOLERANCE
+
+
+@pytest.mark.parametrize("retry_after", ["inf", "-inf", "nan", "-5"])
+def test_retry_after_rejects_invalid_seconds(retry_after: str):
+    hook = HttpHeaderRetryAfterBackOffHook()
+    context = make_context("/pokemon/charmander")
+    response = httpx.Response(
+        HTTPStatus.TOO_MANY_REQUESTS,
+        headers={"retry-after": retry_after},
+        request=httpx.Request("GET", context.url),
+    )
+
+    assert hook._parse_retry_after_as_seconds(response) == 0
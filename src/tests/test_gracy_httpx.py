@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+import httpx
 import pytest
+import sqlite3
 import typing as t
+from datetime import datetime, timedelta
 from http import HTTPStatus
+from unittest.mock import AsyncMock, patch
 
-from gracy import GracefulRetry, Gracy, GracyConfig
-from tests.conftest import PRESENT_POKEMON_NAME, REPLAY, PokeApiEndpoint
+from gracy import GracefulRetry, Gracy, GracyConfig, graceful
+from gracy.exceptions import NonOkResponse, UnexpectedResponse
+from gracy.replays.storages.sqlite import SQLiteReplayStorage
+from tests.conftest import MISSING_NAME, PRESENT_POKEMON_NAME, REPLAY, PokeApiEndpoint
 
 RETRY: t.Final = GracefulRetry(
     delay=0.001,
@@ -45,3 +51,208 @@ async def test_pass_kwargs(make_pokeapi: MAKE_POKEAPI_TYPE):
         dict(NAME=PRESENT_POKEMON_NAME),
         follow_redirects=True,
     )
+
+
+def test_http2_falls_back_without_h2(caplog: pytest.LogCaptureFixture):
+    class Http2PokeAPI(Gracy[PokeApiEndpoint]):
+        class Config:
+            BASE_URL = "https://pokeapi.co/api/v2/"
+            HTTP2 = True
+
+    with patch("gracy._core.find_spec", return_value=None):
+        pokeapi = Http2PokeAPI()
+
+    assert pokeapi._client._transport._pool._http2 is False
+    assert "h2" in caplog.text
+
+
+def test_merged_configs_are_reused(make_pokeapi: MAKE_POKEAPI_TYPE):
+    pokeapi = make_pokeapi()
+    custom_config = GracyConfig(allowed_status_code=HTTPStatus.GONE)
+
+    first = pokeapi._get_merged_config(custom_config)
+    second = pokeapi._get_merged_config(custom_config)
+
+    assert first is second
+    assert first.allowed_status_code == HTTPStatus.GONE
+    assert first.retry is RETRY
+
+
+def test_config_changes_after_creation_are_applied(make_pokeapi: MAKE_POKEAPI_TYPE):
+    config = GracyConfig()
+    assert config.has_retry is False
+    assert config._fastpath is True
+
+    config.retry = RETRY
+
+    assert config.has_retry is True
+    assert config._fastpath is False
+
+    pokeapi = make_pokeapi()
+    custom_config = GracyConfig(retry=None)
+    assert pokeapi._get_merged_config(custom_config).retry is None
+
+    custom_config.retry = RETRY
+    assert pokeapi._get_merged_config(custom_config).has_retry is True
+
+
+def test_fastpath_is_refreshed_on_merge():
+    base_config = GracyConfig()
+    merged = GracyConfig.merge_config(base_config, GracyConfig(retry=RETRY))
+
+    assert base_config._fastpath is True
+    assert merged._fastpath is False
+
+
+async def test_fastpath_still_validates_status():
+    class PlainPokeAPI(Gracy[PokeApiEndpoint]):
+        class Config:
+            BASE_URL = "https://pokeapi.co/api/v2/"
+
+    pokeapi = PlainPokeAPI(REPLAY)
+    assert pokeapi._base_config._fastpath is True
+
+    response = await pokeapi.get(
+        PokeApiEndpoint.GET_POKEMON, dict(NAME=PRESENT_POKEMON_NAME)
+    )
+    assert response.status_code == HTTPStatus.OK
+
+    with pytest.raises(NonOkResponse):
+        await pokeapi.get(PokeApiEndpoint.GET_POKEMON, dict(NAME=MISSING_NAME))
+
+
+def test_request_func_is_built_once_per_client(make_pokeapi: t.Callable[[], Gracy]):
+    pokeapi = make_pokeapi()
+
+    request_func = pokeapi._get_request_func()
+    assert pokeapi._get_request_func() is request_func
+
+    with patch.object(pokeapi, "_client"):
+        assert pokeapi._get_request_func() is not request_func
+
+
+async def test_context_manager_closes_client():
+    async with GracefulPokeAPI(REPLAY) as pokeapi:
+        assert pokeapi._client.is_closed is False
+
+    assert pokeapi._client.is_closed is True
+
+
+class NegativeCachePokeAPI(Gracy[PokeApiEndpoint]):
+    class Config:
+        BASE_URL = "https://pokeapi.co/api/v2/"
+        NEGATIVE_CACHE_TTL = 60
+
+    @graceful(strict_status_code=HTTPStatus.OK)
+    async def get_pokemon_strictly(self, name: str):
+        return await self.get(PokeApiEndpoint.GET_POKEMON, {"NAME": name})
+
+    @graceful(allowed_status_code=HTTPStatus.NOT_FOUND, parser={"default": None})
+    async def get_pokemon_or_none(self, name: str):
+        return await self.get(PokeApiEndpoint.GET_POKEMON, {"NAME": name})
+
+
+async def test_negative_cache_fails_fast_on_known_bad_requests():
+    Gracy.dangerously_reset_report()
+    pokeapi = NegativeCachePokeAPI(REPLAY)
+    after_hook = AsyncMock()
+
+    with patch.object(pokeapi, "after", after_hook):
+        with pytest.raises(NonOkResponse) as first:
+            await pokeapi.get(PokeApiEndpoint.GET_POKEMON, {"NAME": MISSING_NAME})
+
+        replays_made = REPLAY.replays_made
+        with pytest.raises(NonOkResponse) as second:
+            await pokeapi.get(PokeApiEndpoint.GET_POKEMON, {"NAME": MISSING_NAME})
+
+    assert REPLAY.replays_made == replays_made  # Didn't reach the storage again
+    assert second.value is not first.value
+    assert second.value.response is first.value.response
+    assert after_hook.await_count == 2
+    assert pokeapi.get_report().requests[0].total_requests == 2
+
+
+async def test_negative_cache_is_kept_per_config():
+    Gracy.dangerously_reset_report()
+    pokeapi = NegativeCachePokeAPI(REPLAY)
+
+    with pytest.raises(UnexpectedResponse):
+        await pokeapi.get_pokemon_strictly(MISSING_NAME)
+
+    assert await pokeapi.get_pokemon_or_none(MISSING_NAME) is None
+
+
+def test_endpoint_formats_as_its_value():
+    endpoint = PokeApiEndpoint.GET_POKEMON
+
+    assert str(endpoint) == endpoint.value
+    assert f"{endpoint}" == endpoint.value
+
+
+async def test_sqlite_storage_reuses_found_replays(tmp_path):
+    storage = SQLiteReplayStorage(dir=str(tmp_path))
+    storage.prepare()
+
+    request = httpx.Request("GET", "https://pokeapi.co/api/v2/pokemon/pikachu")
+    await storage.record(httpx.Response(HTTPStatus.OK, request=request))
+    first = await storage.load(request, None)
+
+    with patch.object(storage, "_con") as con:
+        second = await storage.load(request, None)
+
+    con.cursor.assert_not_called()
+    assert second is not first  # Each replay gets its own response
+    assert second.status_code == HTTPStatus.OK
+
+    # Recording it again drops what was found before
+    await storage.record(httpx.Response(HTTPStatus.ACCEPTED, request=request))
+    assert (await storage.load(request, None)).status_code == HTTPStatus.ACCEPTED
+
+
+async def test_sqlite_storage_compresses_recordings(tmp_path):
+    storage = SQLiteReplayStorage(dir=str(tmp_path), cache_size=0, compress_level=1)
+    storage.prepare()
+
+    request = httpx.Request("GET", "https://pokeapi.co/api/v2/pokemon/pikachu")
+    await storage.record(
+        httpx.Response(HTTPStatus.OK, json={"name": "pikachu"}, request=request)
+    )
+
+    stored, _ = storage._find_record(request)
+    assert stored[:1] == b"\x78"  # zlib
+    assert (await storage.load(request, None)).json() == {"name": "pikachu"}
+
+    # Uncompressed recordings are still readable
+    uncompressed = SQLiteReplayStorage(dir=str(tmp_path), cache_size=0)
+    uncompressed.prepare()
+    await uncompressed.record(httpx.Response(HTTPStatus.ACCEPTED, request=request))
+    assert (await storage.load(request, None)).status_code == HTTPStatus.ACCEPTED
+
+
+async def test_sqlite_storage_commits_recordings_in_batches(tmp_path):
+    storage = SQLiteReplayStorage(dir=str(tmp_path), batch_size=10)
+    storage.prepare()
+
+    def count_stored() -> int:
+        with sqlite3.connect(str(storage.db_file)) as con:
+            return con.execute("SELECT COUNT(*) FROM gracy_recordings").fetchone()[0]
+
+    for name in ("pikachu", "bulbasaur"):
+        request = httpx.Request("GET", f"https://pokeapi.co/api/v2/pokemon/{name}")
+        await storage.record(httpx.Response(HTTPStatus.OK, request=request))
+
+    assert count_stored() == 0
+    storage.flush()
+    assert count_stored() == 2
+
+
+async def test_sqlite_storage_discards_old_replays(tmp_path):
+    storage = SQLiteReplayStorage(dir=str(tmp_path), cache_size=0)
+    storage.prepare()
+
+    request = httpx.Request("GET", "https://pokeapi.co/api/v2/pokemon/pikachu")
+    await storage.record(httpx.Response(HTTPStatus.OK, request=request))
+
+    an_hour_ago = datetime.now() - timedelta(hours=1)
+    assert await storage.find_replay(request, an_hour_ago) is not None
+    assert await storage.find_replay(request, datetime.now()) is None
@@ -6,6 +6,11 @@ import pytest
 import typing as t
 
 from gracy import GracefulValidator, Gracy, GracyConfig, LogEvent, LogLevel
+from gracy._loggers import (
+    LogTemplate,
+    SafeDict,
+    _get_log_template,
+)
 from gracy.exceptions import NonOkResponse
 from tests.conftest import MISSING_NAME, PRESENT_POKEMON_NAME, REPLAY, PokeApiEndpoint
 
@@ -66,3 +71,28 @@ async def test_pokemon_log_request_response_error(
     assert_log(caplog.records[0], ON_REQUEST)
     assert_log(caplog.records[1], ON_RESPONSE)
     assert_log(caplog.records[2], ON_ERROR)
+
+
+@pytest.mark.parametrize(
+    "template",
+    [
+        "{REPLAY}[{METHOD}] {URL} returned {STATUS}",
+        "100% of {URL} {{escaped}} {MISSING}",
+        "{URL!r} took {ELAPSED:>10}",
+    ],
+)
+def test_log_template_matches_format_map(template: str):
+    format_args = SafeDict(
+        REPLAY="", METHOD="GET", URL="https://pokeapi.co", STATUS="200", ELAPSED="1s"
+    )
+
+    assert LogTemplate(template).format_map(format_args) == template.format_map(
+        format_args
+    )
+
+
+def test_custom_messages_are_parsed_once():
+    first = _get_log_template(ON_REQUEST.custom_message)
+    second = _get_log_template(ON_REQUEST.custom_message)
+
+    assert first is second
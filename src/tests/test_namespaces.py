@@ -68,3 +68,15 @@ async def test_get_from_namespaces(make_pokeapi: MAKE_POKEAPI_TYPE):
     assert_muiti_endpoints_requests_made(
         pokeapi, EXPECTED_ENDPOINTS, *EXPECTED_REQUESTS
     )
+
+
+def test_namespaces_are_resolved_once_per_class(make_pokeapi: MAKE_POKEAPI_TYPE):
+    first = make_pokeapi()
+    second = make_pokeapi()
+
+    assert first._get_namespace_types() is second._get_namespace_types()
+    assert dict(first._get_namespace_types()) == {
+        "berry": BerryNamespace,
+        "pokemon": PokemonNamespace,
+    }
+    assert isinstance(second.berry, BerryNamespace)
@@ -5,8 +5,8 @@ import pytest
 import typing as t
 from http import HTTPStatus
 
-from gracy import Gracy, GracyConfig, graceful
-from gracy.exceptions import GracyParseFailed
+from gracy import Gracy, GracyConfig, GracyRequestContext, graceful
+from gracy.exceptions import GracyParseFailed, GracyUserDefinedException
 from tests.conftest import (
     MISSING_NAME,
     PRESENT_POKEMON_NAME,
@@ -33,6 +33,14 @@ class GracefulPokeAPI(Gracy[PokeApiEndpoint]):
             PokeApiEndpoint.GET_POKEMON, {"NAME": name}
         )
 
+    @graceful(
+        parser={"default": lambda r: r.json(), HTTPStatus.NOT_FOUND: lambda r: None}
+    )
+    async def get_pokemon_or_none(self, name: str):
+        return await self.get[t.Optional[t.Dict[str, t.Any]]](
+            PokeApiEndpoint.GET_POKEMON, {"NAME": name}
+        )
+
 
 @pytest.fixture()
 def make_pokeapi():
@@ -57,9 +65,12 @@ async def test_pokemon_ok_json(make_pokeapi: t.Callable[[], GracefulPokeAPI]):
 async def test_pokemon_bad_json(make_pokeapi: t.Callable[[], GracefulPokeAPI]):
     pokeapi = make_pokeapi()
 
-    with pytest.raises(GracyParseFailed):
+    with pytest.raises(GracyParseFailed) as excinfo:
         await pokeapi.get_pokemon(MISSING_NAME)
 
+    assert excinfo.value._message is None  # Only built when shown
+    assert "Unable to parse result from [GET]" in str(excinfo.value)
+    assert excinfo.value.args == (str(excinfo.value),)
     assert_one_request_made(pokeapi)
 
 
@@ -70,3 +81,32 @@ async def test_pokemon_not_found_as_none(make_pokeapi: t.Callable[[], GracefulPo
 
     assert result is None
     assert_one_request_made(pokeapi)
+
+
+async def test_pokemon_exact_status_parser_wins_over_default(
+    make_pokeapi: t.Callable[[], GracefulPokeAPI],
+):
+    pokeapi = make_pokeapi()
+
+    found = await pokeapi.get_pokemon_or_none(PRESENT_POKEMON_NAME)
+    missing = await pokeapi.get_pokemon_or_none(MISSING_NAME)
+
+    assert isinstance(found, dict)
+    assert missing is None
+
+
+def test_user_defined_exception_formats_used_fields():
+    class PokemonNotFound(GracyUserDefinedException):
+        BASE_MESSAGE = "[{METHOD}] {URL.path} returned {STATUS}"
+
+    context = GracyRequestContext(
+        "GET", "https://pokeapi.co/api/v2", "/pokemon/doesnt-exist", None, GracyConfig()
+    )
+    response = httpx.Response(
+        HTTPStatus.NOT_FOUND, request=httpx.Request("GET", context.url)
+    )
+
+    # ELAPSED isn't available on this response, so it must not be computed
+    exc = PokemonNotFound(context, response)
+
+    assert str(exc) == "[GET] /api/v2/pokemon/doesnt-exist returned 404"
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import httpx
 import logging
 import pytest
@@ -62,6 +63,20 @@ RETRY_3_TIMES_OVERRIDE_PLACEHOLDER_LOG: t.Final = GracefulRetry(
     log_after=LogEvent(LogLevel.WARNING, "AFTER: {RETRY_CAUSE}"),
 )
 
+RETRY_WITHOUT_DELAY: t.Final = GracefulRetry(
+    delay=0, max_attempts=2, retry_on=HTTPStatus.NOT_FOUND
+)
+
+RETRY_WITH_TOTAL_TIMEOUT: t.Final = GracefulRetry(
+    delay=60,
+    max_attempts=3,
+    retry_on=HTTPStatus.NOT_FOUND,
+    total_timeout=1,
+    log_exhausted=LogEvent(
+        LogLevel.WARNING, "GAVE UP: {CUR_ATTEMPT} out of {MAX_ATTEMPT}"
+    ),
+)
+
 
 def assert_log(record: logging.LogRecord, expected_event: LogEvent):
     assert record.levelno == expected_event.level
@@ -122,6 +137,14 @@ class GracefulPokeAPI(Gracy[PokeApiEndpoint]):
     async def get_pokemon_with_retry_overriden_log_placeholder(self, name: str):
         return await self.get(PokeApiEndpoint.GET_POKEMON, {"NAME": name})
 
+    @graceful(retry=RETRY_WITHOUT_DELAY)
+    async def get_pokemon_without_delay(self, name: str):
+        return await self.get(PokeApiEndpoint.GET_POKEMON, {"NAME": name})
+
+    @graceful(retry=RETRY_WITH_TOTAL_TIMEOUT)
+    async def get_pokemon_with_total_timeout(self, name: str):
+        return await self.get(PokeApiEndpoint.GET_POKEMON, {"NAME": name})
+
 
 @pytest.fixture()
 def make_pokeapi():
@@ -434,3 +457,102 @@ async def test_retry_without_replay_request_without_response_generic(
             await pokeapi.get_pokemon(PRESENT_POKEMON_NAME)
 
     assert_requests_made(pokeapi, EXPECTED_REQS)
+
+
+def test_retry_delays_grow_with_modifier():
+    retry = GracefulRetry(delay=1, max_attempts=3, delay_modifier=2)
+    state = retry.create_state(None, None)
+
+    delays: list[float] = []
+    for _ in range(retry.max_attempts):
+        state.increment(None)
+        delays.append(state.delay)
+
+    assert delays == [1, 2, 4]
+
+    state.increment(None)  # Exhausted
+    assert state.delay == 4
+
+
+def test_retry_delays_are_bounded_for_many_attempts():
+    retry = GracefulRetry(delay=1, max_attempts=10_000_000, delay_modifier=1)
+    state = retry.create_state(None, None)
+    state.cur_attempt = retry.max_attempts + 5
+
+    assert len(retry._delays) < retry.max_attempts
+    assert state.next_delay(None) == 1
+
+    growing = GracefulRetry(delay=1, max_attempts=40, delay_modifier=2)
+    assert growing._delay_for(39) == 2**39
+
+
+def test_retry_delays_follow_changes_after_creation():
+    retry = GracefulRetry(delay=1, max_attempts=0, retry_on=HTTPStatus.NOT_FOUND)
+    retry.max_attempts = 2
+    retry.delay_modifier = 3
+    retry.retry_on = HTTPStatus.GONE
+
+    assert retry._delays == (1, 3)
+    assert retry.needs_retry(HTTPStatus.GONE) is True
+    assert retry.needs_retry(HTTPStatus.NOT_FOUND) is False
+
+
+def test_needs_retry_sees_codes_added_in_place():
+    retry = GracefulRetry(delay=0, max_attempts=1, retry_on={ValueError})
+    assert retry.needs_retry(HTTPStatus.NOT_FOUND) is False
+
+    t.cast(t.Set[t.Any], retry.retry_on).add(HTTPStatus.NOT_FOUND)
+
+    assert retry.needs_retry(HTTPStatus.NOT_FOUND) is True
+    assert GracyConfig(retry=retry).should_retry(
+        httpx.Response(HTTPStatus.NOT_FOUND), None
+    )
+
+
+async def test_retry_total_timeout_stops_retrying(
+    make_pokeapi: PokeApiFactory, caplog: pytest.LogCaptureFixture
+):
+    pokeapi = make_pokeapi(0)
+
+    # Would sleep for a minute if it didn't respect the total timeout
+    await asyncio.wait_for(
+        pokeapi.get_pokemon_with_total_timeout(MISSING_NAME), timeout=1
+    )
+
+    assert_requests_made(pokeapi, 1)
+    # No retry attempt was made, and giving up is still logged
+    assert [record.message for record in caplog.records] == ["GAVE UP: 0 out of 3"]
+
+
+def test_merged_config_resolves_has_retry():
+    base = GracyConfig(retry=None)
+    custom = GracyConfig(retry=GracefulRetry(delay=0, max_attempts=1))
+
+    assert base.has_retry is False
+    assert GracyConfig.merge_config(base, custom).has_retry is True
+
+
+def test_merging_unset_config_keeps_base():
+    base = GracyConfig(retry=None)
+
+    assert GracyConfig.merge_config(base, GracyConfig()) is base
+
+
+async def test_retry_without_delay_doesnt_sleep(make_pokeapi: PokeApiFactory):
+    pokeapi = make_pokeapi(0)
+
+    with patch("gracy._core.sleep") as sleep:
+        await pokeapi.get_pokemon_without_delay(MISSING_NAME)
+
+    sleep.assert_not_called()
+    assert_requests_made(pokeapi, 3)
+
+
+def test_needs_retry_checks_codes():
+    retry = GracefulRetry(
+        delay=0, max_attempts=1, retry_on={HTTPStatus.NOT_FOUND, ValueError}
+    )
+
+    assert retry.needs_retry(HTTPStatus.NOT_FOUND) is True
+    assert retry.needs_retry(HTTPStatus.OK) is False
+    assert GracefulRetry(delay=0, max_attempts=1).needs_retry(HTTPStatus.OK) is True
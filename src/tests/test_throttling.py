@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import asyncio
+import re
+from datetime import timedelta
+
+from gracy import GracyConfig, GracyRequestContext
+from gracy._models import (
+    GracefulThrottle,
+    ThrottleController,
+    ThrottleLocker,
+    ThrottleRule,
+)
+
+WINDOW = timedelta(milliseconds=100)
+
+
+def make_context(endpoint: str) -> GracyRequestContext:
+    return GracyRequestContext(
+        "GET", "https://pokeapi.co/api/v2", endpoint, None, GracyConfig()
+    )
+
+
+async def test_requests_per_rule_counts_only_matching_urls_within_window():
+    controller = ThrottleController()
+    pokemon_pattern = re.compile(r".*/pokemon/.*")
+
+    controller.init_request(make_context("/pokemon/charmander"))
+    assert controller.calculate_requests_per_rule(pokemon_pattern, WINDOW) == 1
+
+    controller.init_request(make_context("/pokemon/bulbasaur"))
+    controller.init_request(make_context("/berry/cheri"))
+    assert controller.calculate_requests_per_rule(pokemon_pattern, WINDOW) == 2
+
+    await asyncio.sleep(WINDOW.total_seconds() * 1.5)
+    assert controller.calculate_requests_per_rule(pokemon_pattern, WINDOW) == 0
+
+
+async def test_throttled_requests_share_the_rule_release():
+    locker = ThrottleLocker()
+    rule = ThrottleRule(r".*/pokemon/.*", 1)
+    assert locker.wait_rule_release(rule) is None  # Nothing to wait for
+
+    async def hold_rule():
+        with locker.lock_rule(rule):
+            await asyncio.sleep(WINDOW.total_seconds())
+
+    holder = asyncio.create_task(hold_rule())
+    await asyncio.sleep(0)
+
+    first_waiter = locker.wait_rule_release(rule)
+    second_waiter = locker.wait_rule_release(rule)
+    assert first_waiter is not None
+    assert first_waiter is second_waiter
+
+    await asyncio.wait_for(asyncio.shield(first_waiter), timeout=1)
+    await holder
+
+
+def test_rule_matches_urls_by_pattern():
+    rule = ThrottleRule(r".*/pokemon/.*", 1)
+
+    assert rule.matches("https://pokeapi.co/api/v2/pokemon/charmander") is True
+    assert rule.matches("https://pokeapi.co/api/v2/berry/cheri") is False
+    assert rule.matches("https://pokeapi.co/api/v2/pokemon/charmander") is True
+
+
+def test_new_rule_window_tracks_already_seen_urls():
+    controller = ThrottleController()
+    pokemon_pattern = re.compile(r".*/pokemon/.*")
+    context = make_context("/pokemon/charmander")
+
+    controller.init_request(context)
+    assert controller.calculate_requests_per_rule(re.compile(".*"), WINDOW) == 1
+
+    # The URL was already resolved to its windows before this rule was checked
+    controller.init_request(context)
+    assert controller.calculate_requests_per_rule(pokemon_pattern, WINDOW) == 2
+    controller.init_request(context)
+    assert controller.calculate_requests_per_rule(pokemon_pattern, WINDOW) == 3
+
+
+def test_throttle_rules_are_stored_as_tuple():
+    rule = ThrottleRule(r".*/pokemon/.*", 1)
+
+    assert GracefulThrottle(rule).rules == (rule,)
+    assert GracefulThrottle(r for r in [rule]).rules == (rule,)
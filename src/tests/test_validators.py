@@ -5,7 +5,8 @@ import pytest
 import typing as t
 from http import HTTPStatus
 
-from gracy import GracefulValidator, Gracy, graceful
+from gracy import GracefulValidator, Gracy, GracyConfig, graceful
+from gracy._validators import AllowedStatusValidator, StrictStatusValidator
 from gracy.exceptions import NonOkResponse, UnexpectedResponse
 from tests.conftest import (
     MISSING_NAME,
@@ -115,3 +116,46 @@ async def test_pokemon_allow_404(make_pokeapi: t.Callable[[], GracefulPokeAPI]):
 
     assert result.status_code == HTTPStatus.NOT_FOUND
     assert_one_request_made(pokeapi)
+
+
+def test_config_keeps_status_codes_as_given():
+    allowed = [HTTPStatus.NOT_FOUND, HTTPStatus.GONE]
+    config = GracyConfig(strict_status_code=HTTPStatus.OK, allowed_status_code=allowed)
+
+    assert config.strict_status_code is HTTPStatus.OK
+    assert config.allowed_status_code is allowed
+
+
+def test_strict_validator_lists_expected_codes_in_order():
+    request = httpx.Request("GET", "https://pokeapi.co/api/v2/pokemon/doesnt-exist")
+    response = httpx.Response(HTTPStatus.NOT_FOUND, request=request)
+    validator = StrictStatusValidator([201, 200, 202])
+
+    with pytest.raises(UnexpectedResponse) as exc:
+        validator.check(response)
+
+    assert str(exc.value).endswith("but it was expecting 201, 200, 202")
+
+
+def test_config_builds_validators_once():
+    custom = CustomValidator()
+    config = GracyConfig(allowed_status_code=HTTPStatus.NOT_FOUND, validators=custom)
+
+    validators = config.get_validators()
+
+    assert isinstance(validators[0], AllowedStatusValidator)
+    assert validators[1] is custom
+    assert config.get_validators() is validators
+
+
+def test_bad_response_message_is_built_when_shown():
+    request = httpx.Request("GET", "https://pokeapi.co/api/v2/pokemon/doesnt-exist")
+    response = httpx.Response(HTTPStatus.NOT_FOUND, request=request)
+
+    exc = UnexpectedResponse(request.url, response, frozenset({200}))
+
+    assert exc._message is None
+    assert exc.url == str(request.url)
+    assert str(exc) == f"{request.url} raised 404, but it was expecting 200"
+    assert repr(exc) == f"UnexpectedResponse({str(exc)!r})"
+    assert exc.args == (str(exc),)